@@ -0,0 +1,171 @@
+"""Pluggable aggregation strategies for forecast years.
+
+A strategy turns the years of one category into a single year. Every
+strategy receives plain column data - years, per-point weights
+(sqrt(num_forecasters) by default) and update timestamps (NaN when
+unknown) - and has a vectorized NumPy path plus a pure-Python fallback.
+
+Register new strategies with ``register_strategy``:
+
+    >>> @register_strategy("midrange")
+    ... def midrange(years, weights, timestamps):
+    ...     return (min(years) + max(years)) / 2
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Optional, Sequence
+
+from .stats import _use_numpy, forecaster_weights, weighted_mean, weighted_median
+
+# (years, weights, timestamps) -> aggregated year
+AggregationStrategy = Callable[[Sequence[float], Sequence[float], Sequence[float]], float]
+
+_STRATEGIES: dict[str, AggregationStrategy] = {}
+
+DEFAULT_STRATEGY = "weighted_mean"
+
+# Fraction of total weight cut from each tail by the trimmed mean
+TRIM_FRACTION = 0.1
+
+# Year window that log-odds pooling maps onto (0, 1)
+LOG_ODDS_WINDOW = (2024.0, 2201.0)
+
+# Half-life of the recency weighting (days)
+RECENCY_HALF_LIFE_DAYS = 90.0
+
+
+def register_strategy(name: str) -> Callable[[AggregationStrategy], AggregationStrategy]:
+    """Decorator registering an aggregation strategy under ``name``."""
+    def decorator(func: AggregationStrategy) -> AggregationStrategy:
+        _STRATEGIES[name] = func
+        return func
+    return decorator
+
+
+def get_strategy(name: str) -> AggregationStrategy:
+    """Look up a registered strategy.
+
+    Raises:
+        ValueError: If no strategy is registered under ``name``.
+    """
+    try:
+        return _STRATEGIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown aggregation strategy {name!r}; "
+            f"available: {', '.join(available_strategies())}"
+        ) from None
+
+
+def available_strategies() -> list[str]:
+    """Names of all registered strategies."""
+    return sorted(_STRATEGIES)
+
+
+def aggregate_columns(
+    years: Sequence[float],
+    num_forecasters: Sequence[int],
+    timestamps: Optional[Sequence[float]] = None,
+    strategy: str = DEFAULT_STRATEGY,
+) -> float:
+    """Aggregate column data with a named strategy.
+
+    Args:
+        years: Non-empty sequence of forecast years.
+        num_forecasters: Forecaster counts, turned into sqrt weights.
+        timestamps: Optional update timestamps (NaN when unknown).
+        strategy: Registered strategy name.
+    """
+    func = get_strategy(strategy)
+    weights = forecaster_weights(num_forecasters)
+    if timestamps is None:
+        timestamps = [math.nan] * len(years)
+    return float(func(years, weights, timestamps))
+
+
+@register_strategy("weighted_mean")
+def _weighted_mean(years, weights, timestamps) -> float:
+    return weighted_mean(years, weights)
+
+
+@register_strategy("weighted_median")
+def _weighted_median(years, weights, timestamps) -> float:
+    return weighted_median(years, weights)
+
+
+@register_strategy("trimmed_mean")
+def _trimmed_mean(years, weights, timestamps) -> float:
+    """Weighted mean after dropping TRIM_FRACTION of the weight from each tail."""
+    n = len(years)
+    np = _use_numpy(n)
+    if np is not None:
+        y = np.asarray(years, dtype=np.float64)
+        w = np.asarray(weights, dtype=np.float64)
+        order = np.argsort(y, kind="stable")
+        y, w = y[order], w[order]
+        cumulative = np.cumsum(w)
+        total = cumulative[-1]
+        lo, hi = TRIM_FRACTION * total, (1 - TRIM_FRACTION) * total
+        # Weight of each point that lies inside the [lo, hi] band
+        kept = np.clip(np.minimum(cumulative, hi) - np.maximum(cumulative - w, lo), 0, None)
+        kept_total = kept.sum()
+        return float(y @ kept / kept_total) if kept_total else float(np.median(y))
+
+    pairs = sorted(zip(years, weights))
+    total = math.fsum(w for _, w in pairs)
+    lo, hi = TRIM_FRACTION * total, (1 - TRIM_FRACTION) * total
+    acc = weighted_sum = kept_total = 0.0
+    for y, w in pairs:
+        kept = max(0.0, min(acc + w, hi) - max(acc, lo))
+        weighted_sum += y * kept
+        kept_total += kept
+        acc += w
+    return weighted_sum / kept_total if kept_total else pairs[n // 2][0]
+
+
+@register_strategy("log_odds")
+def _log_odds(years, weights, timestamps) -> float:
+    """Weighted mean in log-odds space over LOG_ODDS_WINDOW.
+
+    Years are mapped to a fraction of the window, pooled as weighted
+    log-odds and mapped back, which tempers the pull of far-future outliers.
+    """
+    start, end = LOG_ODDS_WINDOW
+    span = end - start
+    eps = 1e-6
+    np = _use_numpy(len(years))
+    if np is not None:
+        p = np.clip((np.asarray(years, dtype=np.float64) - start) / span, eps, 1 - eps)
+        pooled = weighted_mean(np.log(p / (1 - p)), weights)
+    else:
+        logits = []
+        for y in years:
+            p = min(1 - eps, max(eps, (y - start) / span))
+            logits.append(math.log(p / (1 - p)))
+        pooled = weighted_mean(logits, weights)
+    return start + span / (1 + math.exp(-pooled))
+
+
+@register_strategy("recency_weighted")
+def _recency_weighted(years, weights, timestamps) -> float:
+    """Weighted mean with weights halved every RECENCY_HALF_LIFE_DAYS of age.
+
+    Points without an update timestamp keep their full weight.
+    """
+    now = time.time()
+    half_life = RECENCY_HALF_LIFE_DAYS * 86400
+    np = _use_numpy(len(years))
+    if np is not None:
+        ts = np.asarray(timestamps, dtype=np.float64)
+        age = np.where(np.isnan(ts), 0.0, np.maximum(now - ts, 0.0))
+        decayed = np.asarray(weights, dtype=np.float64) * np.exp2(-age / half_life)
+        return weighted_mean(years, decayed)
+
+    decayed = [
+        w if math.isnan(ts) else w * 2 ** (-max(now - ts, 0.0) / half_life)
+        for w, ts in zip(weights, timestamps)
+    ]
+    return weighted_mean(years, decayed)
@@ -7,15 +7,41 @@ from multiple sources and generates unified predictions with confidence metrics.
 from __future__ import annotations
 
 import logging
-import statistics
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from threading import Lock
-from typing import Callable, Optional
+from itertools import repeat
+from threading import Event, Lock, Thread
+from typing import Callable, Iterable, Optional, Sequence
 
+from .aggregation import DEFAULT_STRATEGY, get_strategy
+from .batch import ForecastBatch
+from .bootstrap import (
+    DEFAULT_LEVEL,
+    DEFAULT_RESAMPLES,
+    ConfidenceInterval,
+    bootstrap_interval,
+)
+from .incremental import ALL, IncrementalAggregator, RunningStats
 from .models import Prediction
-from .scraper import ForecastPoint, fetch_agi_forecasts, aggregate_forecasts
+from .rules import CategoryRule, CompiledRuleSet, RuleSet
+from .scraper import (
+    ForecastPoint,
+    aggregate_forecasts,
+    fetch_forecast_batch,
+)
+from .simulation import (
+    DEFAULT_DRAWS,
+    MIN_ASI_GAP_YEARS,
+    MODERATE_GAP_YEARS,
+    RAPID_GAP_YEARS,
+    ScenarioMix,
+    YearDistribution,
+    simulate_scenarios,
+)
+from .snapshot import SnapshotStore
+from .stats import get_numpy, summarize
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -45,9 +71,9 @@ class TakeoffScenario(Enum):
     @classmethod
     def from_year_gap(cls, gap: float) -> "TakeoffScenario":
         """Determine takeoff scenario from AGI-to-ASI year gap."""
-        if gap < 5:
+        if gap < RAPID_GAP_YEARS:
             return cls.RAPID
-        elif gap < 15:
+        elif gap < MODERATE_GAP_YEARS:
             return cls.MODERATE
         return cls.SLOW
 
@@ -63,8 +89,9 @@ class ConsensusType(Enum):
 @dataclass
 class CacheEntry:
     """Cache entry with timestamp for TTL-based invalidation."""
-    data: list[ForecastPoint]
+    data: ForecastBatch
     timestamp: datetime
+    from_snapshot: bool = False
     
     def is_expired(self, ttl_seconds: int) -> bool:
         """Check if cache entry has expired."""
@@ -72,6 +99,22 @@ class CacheEntry:
         return age > ttl_seconds
 
 
+@dataclass
+class _InflightFetch:
+    """A fetch in progress that concurrent callers can wait on."""
+    done: Event = field(default_factory=Event)
+    data: Optional[ForecastBatch] = None
+    error: Optional[BaseException] = None
+    
+    def wait(self) -> ForecastBatch:
+        """Block until the fetch finishes and return its result."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        assert self.data is not None
+        return self.data
+
+
 @dataclass
 class ConfidenceMetrics:
     """Statistical confidence metrics for predictions."""
@@ -92,8 +135,79 @@ class ConfidenceMetrics:
         self.confidence_score = (size_factor * 0.3 + diversity_factor * 0.3 + spread_factor * 0.4) * 100
 
 
+@dataclass
+class PredictionAnalysis:
+    """Intermediate result shared by predictions and detailed analysis.
+    
+    Built from one fetch, one validation and one classification pass.
+    """
+    points: ForecastBatch
+    classified: dict[str, ForecastBatch]
+    metrics: dict[str, ConfidenceMetrics]
+    prediction: Prediction
+
+
+@dataclass(frozen=True)
+class PredictionConfig:
+    """One configuration evaluated by ``PredictionEngine.generate_predictions``.
+    
+    Year and forecaster bounds left as None use the engine's validation
+    defaults; ``sources`` restricts the data to those source names.
+    """
+    min_data_points: int = 1
+    min_year: Optional[float] = None
+    max_year: Optional[float] = None
+    min_forecasters: Optional[int] = None
+    aggregation: str | dict[str, str] = DEFAULT_STRATEGY
+    sources: Optional[frozenset[str]] = None
+    label: str = ""
+    
+    def __post_init__(self) -> None:
+        if self.sources is not None:
+            object.__setattr__(self, "sources", frozenset(self.sources))
+
+
+@dataclass
+class SweepResult:
+    """Outcome of one configuration: a prediction, or the validation error."""
+    config: PredictionConfig
+    prediction: Optional[Prediction] = None
+    metrics: dict[str, ConfidenceMetrics] = field(default_factory=dict)
+    error: Optional[PredictionError] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.prediction is not None
+
+
+@dataclass(frozen=True)
+class ClassifierCacheInfo:
+    """Hit/miss counters for the classification cache."""
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
 class ForecastClassifier:
-    """Classifies forecast points into AGI, ASI, and Singularity categories."""
+    """Classifies forecast points into AGI, ASI, and Singularity categories.
+    
+    Matching is driven by a compiled ``RuleSet``; the default one reproduces
+    the built-in keyword sets and precedence (singularity, then ASI, then
+    AGI as the fallback). ``set_rules`` swaps in a different rule set at
+    runtime. Results are memoized in a bounded LRU cache keyed by question
+    text, so repeated refreshes skip classification for questions already
+    seen.
+    
+    Example:
+        >>> classifier = ForecastClassifier(cache_size=10_000)
+        >>> classifier.categorize("Will superintelligence exist by 2040?")
+        'asi'
+        >>> classifier.cache_info().misses
+        1
+    """
+    
+    DEFAULT_CACHE_SIZE = 4096
     
     # Keywords for classification
     AGI_KEYWORDS = frozenset([
@@ -109,35 +223,131 @@ class ForecastClassifier:
         "intelligence explosion", "recursive self-improvement"
     ])
     
-    @classmethod
-    def classify(cls, points: list[ForecastPoint]) -> dict[str, list[ForecastPoint]]:
+    # Precedence: singularity first (most specific), then ASI, then AGI
+    DEFAULT_RULES = RuleSet(
+        categories=(
+            CategoryRule("singularity", priority=0, keywords=tuple(sorted(SINGULARITY_KEYWORDS))),
+            CategoryRule("asi", priority=1, keywords=tuple(sorted(ASI_KEYWORDS))),
+            CategoryRule("agi", priority=2, keywords=tuple(sorted(AGI_KEYWORDS))),
+        ),
+        default_category="agi",
+    )
+    
+    # Categories the engine always expects in classify() results
+    BASE_CATEGORIES = ("agi", "asi", "singularity")
+    
+    _DEFAULT_COMPILED = DEFAULT_RULES.compile()
+    
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        rules: Optional[RuleSet] = None,
+    ):
+        """Initialize the classifier.
+        
+        Args:
+            cache_size: Maximum number of memoized questions. 0 disables
+                the cache.
+            rules: Optional rule set; defaults to ``DEFAULT_RULES``.
+        """
+        self._compiled: CompiledRuleSet = (
+            rules.compile() if rules is not None else self._DEFAULT_COMPILED
+        )
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+    
+    @property
+    def rules(self) -> RuleSet:
+        """The rule set currently in use."""
+        return self._compiled.rules
+    
+    def set_rules(self, rules: RuleSet) -> None:
+        """Hot-swap the rule set.
+        
+        The new rules are compiled before the swap, so concurrent callers
+        never see a half-built matcher. The classification cache is cleared
+        because its entries reflect the old rules.
+        
+        Raises:
+            RuleSetError: If the rule set fails to compile.
+        """
+        compiled = rules.compile()
+        with self._cache_lock:
+            self._compiled = compiled
+            self._generation += 1
+            self._cache.clear()
+    
+    def _match(self, question: str) -> str:
+        """Run the compiled rule set on one question."""
+        return self._compiled.match(question)
+    
+    def categorize(self, question: str) -> str:
+        """Return the category of a question under the current rules."""
+        if self._cache_size <= 0:
+            return self._match(question)
+        
+        with self._cache_lock:
+            category = self._cache.get(question)
+            if category is not None:
+                self._cache.move_to_end(question)
+                self._hits += 1
+                return category
+            self._misses += 1
+            generation = self._generation
+            compiled = self._compiled
+        
+        category = compiled.match(question)
+        
+        with self._cache_lock:
+            # Skip caching if the rules were swapped while we matched
+            if generation == self._generation:
+                self._cache[question] = category
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return category
+    
+    def cache_info(self) -> ClassifierCacheInfo:
+        """Return hit/miss counters and current cache occupancy."""
+        with self._cache_lock:
+            return ClassifierCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=self._cache_size,
+            )
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized classifications and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+    
+    def classify(
+        self, points: ForecastBatch | list[ForecastPoint]
+    ) -> dict[str, ForecastBatch]:
         """Classify forecast points into categories.
         
         Args:
-            points: List of forecast points to classify.
+            points: Batch (or list) of forecast points to classify.
             
         Returns:
-            Dictionary with 'agi', 'asi', and 'singularity' keys.
+            Dictionary with 'agi', 'asi', and 'singularity' keys (plus any
+            extra categories defined by the rule set), each holding the
+            matching rows as a ForecastBatch.
         """
-        classified = {
-            "agi": [],
-            "asi": [],
-            "singularity": []
-        }
+        batch = ForecastBatch.coerce(points)
+        categorize = self.categorize
+        indices: dict[str, list[int]] = {c: [] for c in self.BASE_CATEGORIES}
         
-        for point in points:
-            question_lower = point.question.lower()
-            
-            # Check for singularity first (most specific)
-            if any(kw in question_lower for kw in cls.SINGULARITY_KEYWORDS):
-                classified["singularity"].append(point)
-            elif any(kw in question_lower for kw in cls.ASI_KEYWORDS):
-                classified["asi"].append(point)
-            else:
-                # Default to AGI category
-                classified["agi"].append(point)
+        for i, question in enumerate(batch.questions()):
+            indices.setdefault(categorize(question), []).append(i)
         
-        return classified
+        return {category: batch.take(rows) for category, rows in indices.items()}
 
 
 class PredictionEngine:
@@ -145,13 +355,19 @@ class PredictionEngine:
     
     Features:
     - Optional TTL-based caching to reduce API load
+    - Stale-while-revalidate: expired data is served while one background
+      refresh runs, up to a separate hard-expiry bound
     - Statistical confidence metrics
     - Proper error handling and logging
     - Thread-safe cache access
+    - Single-flight fetching: concurrent refreshes share one scrape
+    - Optional persisted snapshot for a warm start on launch
+    - Optional incremental mode: per-category running statistics updated
+      from point deltas, so re-predicting after a small refresh is cheap
     - Configurable data validation
     
     Example:
-        >>> engine = PredictionEngine(cache_ttl_seconds=300)
+        >>> engine = PredictionEngine(cache_ttl_seconds=300, stale_ttl_seconds=3600)
         >>> prediction = engine.generate_prediction()
         >>> print(f"AGI predicted: {prediction.agi_date}")
     """
@@ -165,7 +381,14 @@ class PredictionEngine:
         self, 
         cache_ttl_seconds: int = 0,
         min_data_points: int = 1,
-        fetch_func: Optional[Callable[[], list[ForecastPoint]]] = None
+        fetch_func: Optional[
+            Callable[[], ForecastBatch | list[ForecastPoint]]
+        ] = None,
+        stale_ttl_seconds: int = 0,
+        snapshot_store: Optional[SnapshotStore] = None,
+        classifier: Optional[ForecastClassifier] = None,
+        incremental: bool = False,
+        aggregation: str | dict[str, str] = DEFAULT_STRATEGY,
     ):
         """Initialize the prediction engine.
         
@@ -173,22 +396,116 @@ class PredictionEngine:
             cache_ttl_seconds: Cache TTL in seconds. 0 disables caching.
             min_data_points: Minimum required data points for prediction.
             fetch_func: Optional custom fetch function for testing.
+            stale_ttl_seconds: Hard expiry in seconds. Entries older than
+                ``cache_ttl_seconds`` but younger than this are returned
+                immediately while a background refresh runs. Values not
+                greater than ``cache_ttl_seconds`` disable stale serving.
+            snapshot_store: Optional store for the last validated points.
+                A stored snapshot is served on the first fetch while a
+                background refresh runs, and each fresh fetch replaces it.
+            classifier: Optional classifier; defaults to a ForecastClassifier
+                with its own classification cache.
+            incremental: If True, keep running per-category statistics and
+                update them from the difference between successive fetches
+                instead of recomputing every aggregate from scratch.
+            aggregation: Registered aggregation strategy used for every
+                category, or a mapping of category name ("agi", "asi",
+                "singularity") to strategy; unmapped categories use
+                "weighted_mean".
+            
+        Raises:
+            ValueError: If a strategy is unknown, or is not
+                "weighted_mean" in incremental mode.
         """
+        strategies = self._resolve_aggregation(aggregation)
+        if incremental and set(strategies.values()) != {DEFAULT_STRATEGY}:
+            raise ValueError("Incremental mode only supports weighted_mean aggregation")
+        
         self._cache: Optional[CacheEntry] = None
         self._cache_lock = Lock()
+        self._inflight: Optional[_InflightFetch] = None
+        self._refreshing = False
         self._cache_ttl = cache_ttl_seconds
+        self._stale_ttl = stale_ttl_seconds
         self._min_data_points = min_data_points
+        self._aggregation = strategies
         self._fetch_func = fetch_func or self._default_fetch
+        self._snapshot_store = snapshot_store
+        self.classifier = classifier or ForecastClassifier()
+        self._aggregator: Optional[IncrementalAggregator] = None
+        self._aggregator_rules: Optional[RuleSet] = None
+        self._aggregator_lock = Lock()
+        if incremental:
+            self._aggregator = IncrementalAggregator(self.classifier.categorize)
+            self._aggregator_rules = self.classifier.rules
+        
+        if snapshot_store is not None:
+            self._load_snapshot()
         
         logger.debug(
             f"PredictionEngine initialized with cache_ttl={cache_ttl_seconds}s, "
-            f"min_data_points={min_data_points}"
+            f"stale_ttl={stale_ttl_seconds}s, min_data_points={min_data_points}"
         )
     
-    def _default_fetch(self) -> list[ForecastPoint]:
+    @staticmethod
+    def _resolve_aggregation(aggregation: str | dict[str, str]) -> dict[str, str]:
+        """Expand an aggregation setting into one validated strategy per category.
+        
+        Raises:
+            ValueError: If a category or strategy is unknown.
+        """
+        if isinstance(aggregation, str):
+            aggregation = dict.fromkeys(ForecastClassifier.BASE_CATEGORIES, aggregation)
+        unknown = set(aggregation) - set(ForecastClassifier.BASE_CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown aggregation categories: {sorted(unknown)}")
+        strategies = {
+            category: aggregation.get(category, DEFAULT_STRATEGY)
+            for category in ForecastClassifier.BASE_CATEGORIES
+        }
+        for strategy in strategies.values():
+            get_strategy(strategy)
+        return strategies
+    
+    def _load_snapshot(self) -> None:
+        """Seed the cache from the persisted snapshot, if there is one."""
+        assert self._snapshot_store is not None
+        try:
+            snapshot = self._snapshot_store.load()
+        except Exception as e:
+            logger.warning(f"Failed to load forecast snapshot: {e}")
+            return
+        
+        if snapshot is None:
+            return
+        
+        points, saved_at = snapshot
+        self._cache = CacheEntry(data=points, timestamp=saved_at, from_snapshot=True)
+        logger.info(f"Loaded {len(points)} forecast points from snapshot saved {saved_at}")
+    
+    def _save_snapshot(self, points: ForecastBatch) -> None:
+        """Persist the valid subset of freshly fetched points."""
+        if self._snapshot_store is None:
+            return
+        
+        valid_points = points.filter(self._valid_mask(points))
+        if not valid_points:
+            return
+        
+        try:
+            self._snapshot_store.save(valid_points)
+        except Exception as e:
+            logger.warning(f"Failed to save forecast snapshot: {e}")
+    
+    @property
+    def has_snapshot(self) -> bool:
+        """True while a persisted snapshot is being served from the cache."""
+        with self._cache_lock:
+            return self._cache is not None and self._cache.from_snapshot
+    
+    def _default_fetch(self) -> ForecastBatch:
         """Default fetch function using the scraper module."""
-        points, _ = fetch_agi_forecasts()
-        return points
+        return fetch_forecast_batch()
     
     def _validate_point(self, point: ForecastPoint) -> bool:
         """Validate a single forecast point.
@@ -209,19 +526,28 @@ class PredictionEngine:
         
         return True
     
-    def _validate_data(self, points: list[ForecastPoint]) -> list[ForecastPoint]:
+    def _valid_mask(self, points: ForecastBatch):
+        """Vectorized form of ``_validate_point`` over a whole batch."""
+        return points.valid_mask(
+            self.MIN_VALID_YEAR, self.MAX_VALID_YEAR, self.MIN_FORECASTERS
+        )
+    
+    def _validate_data(
+        self, points: ForecastBatch | list[ForecastPoint]
+    ) -> ForecastBatch:
         """Validate and filter forecast data.
         
         Args:
             points: Raw forecast points.
             
         Returns:
-            List of validated forecast points.
+            Batch of validated forecast points.
             
         Raises:
             DataValidationError: If insufficient valid data points.
         """
-        valid_points = [p for p in points if self._validate_point(p)]
+        points = ForecastBatch.coerce(points)
+        valid_points = points.filter(self._valid_mask(points))
         
         logger.info(f"Validated {len(valid_points)}/{len(points)} data points")
         
@@ -233,52 +559,176 @@ class PredictionEngine:
         
         return valid_points
 
-    def fetch_data(self, force_refresh: bool = False) -> list[ForecastPoint]:
-        """Fetch forecast data, optionally from cache.
+    def _cached_data_locked(self, allow_stale: bool) -> Optional[ForecastBatch]:
+        """Return cached data if usable, scheduling a refresh for stale hits.
+        
+        Must be called with ``_cache_lock`` held.
         
         Args:
-            force_refresh: If True, bypass cache and fetch fresh data.
+            allow_stale: If True, serve entries past the TTL but within the
+                hard expiry and start a background refresh.
+            
+        Returns:
+            Cached ForecastBatch, or None if the cache cannot be used.
+        """
+        entry = self._cache
+        if entry is None:
+            return None
+        
+        if entry.from_snapshot:
+            # Warm start: serve the snapshot once, refreshing behind it
+            if not allow_stale:
+                return None
+            self._start_background_refresh_locked()
+            logger.debug("Returning snapshot forecast data while refreshing")
+            return entry.data
+        
+        if self._cache_ttl <= 0:
+            return None
+        
+        if not entry.is_expired(self._cache_ttl):
+            logger.debug("Returning cached forecast data")
+            return entry.data
+        
+        if (
+            allow_stale
+            and self._stale_ttl > self._cache_ttl
+            and not entry.is_expired(self._stale_ttl)
+        ):
+            self._start_background_refresh_locked()
+            logger.debug("Returning stale forecast data while refreshing")
+            return entry.data
+        
+        return None
+    
+    def _start_background_refresh_locked(self) -> None:
+        """Start a background refresh unless one is already running.
+        
+        Must be called with ``_cache_lock`` held.
+        """
+        if self._refreshing:
+            return
+        self._refreshing = True
+        Thread(
+            target=self._background_refresh,
+            name="aioracle-refresh",
+            daemon=True,
+        ).start()
+    
+    def _background_refresh(self) -> None:
+        """Refresh the cache off the caller's thread."""
+        try:
+            self._fetch_shared(force_refresh=True)
+        except PredictionError as e:
+            logger.warning(f"Background refresh failed, keeping stale data: {e}")
+        finally:
+            with self._cache_lock:
+                self._refreshing = False
+    
+    def _fetch_shared(self, force_refresh: bool) -> ForecastBatch:
+        """Fetch fresh data, joining an in-flight fetch if there is one.
+        
+        The first caller becomes the leader and performs the scrape; callers
+        arriving while it runs wait for and share its result (or error).
+        
+        Args:
+            force_refresh: If False, a cache entry that became fresh while
+                waiting for the lock is returned instead of fetching.
+            
+        Returns:
+            ForecastBatch of forecast points.
             
+        Raises:
+            DataFetchError: If unable to fetch any data.
+        """
+        with self._cache_lock:
+            if not force_refresh:
+                cached = self._cached_data_locked(allow_stale=False)
+                if cached is not None:
+                    return cached
+            
+            flight = self._inflight
+            if flight is not None:
+                logger.debug("Joining in-flight forecast fetch")
+                is_leader = False
+            else:
+                flight = self._inflight = _InflightFetch()
+                is_leader = True
+        
+        if not is_leader:
+            return flight.wait()
+        
+        try:
+            flight.data = self._fetch_fresh()
+            return flight.data
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight = None
+            flight.done.set()
+    
+    def _fetch_fresh(self) -> ForecastBatch:
+        """Fetch from the sources and update the cache.
+        
         Returns:
-            List of ForecastPoints.
+            ForecastBatch of forecast points.
             
         Raises:
             DataFetchError: If unable to fetch any data.
         """
+        logger.info("Fetching fresh forecast data from sources")
+        try:
+            points = ForecastBatch.coerce(self._fetch_func())
+        except Exception as e:
+            logger.error(f"Failed to fetch forecast data: {e}")
+            raise DataFetchError(f"Failed to fetch data: {e}") from e
+        
+        if not points:
+            raise DataFetchError(
+                "No forecast data retrieved. Check your internet connection."
+            )
+        
+        # Update cache, retiring any warm-start snapshot entry
         with self._cache_lock:
-            # Check cache if enabled and not forcing refresh
-            if (
-                not force_refresh 
-                and self._cache_ttl > 0 
-                and self._cache is not None 
-                and not self._cache.is_expired(self._cache_ttl)
-            ):
-                logger.debug("Returning cached forecast data")
-                return self._cache.data
-            
-            # Fetch fresh data
-            logger.info("Fetching fresh forecast data from sources")
-            try:
-                points = self._fetch_func()
-            except Exception as e:
-                logger.error(f"Failed to fetch forecast data: {e}")
-                raise DataFetchError(f"Failed to fetch data: {e}") from e
-            
-            if not points:
-                raise DataFetchError(
-                    "No forecast data retrieved. Check your internet connection."
-                )
-            
-            # Update cache
             if self._cache_ttl > 0:
                 self._cache = CacheEntry(data=points, timestamp=datetime.now())
                 logger.debug(f"Cached {len(points)} forecast points")
+            else:
+                self._cache = None
+        
+        self._save_snapshot(points)
+        return points
+
+    def fetch_data(self, force_refresh: bool = False) -> ForecastBatch:
+        """Fetch forecast data, optionally from cache.
+        
+        The cache lock is never held across the network fetch, so readers
+        of a fresh or stale entry are not blocked by a refresh in progress.
+        Concurrent callers that need fresh data (including ``force_refresh``
+        callers) share a single in-flight fetch rather than each scraping.
+        
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh data.
+            
+        Returns:
+            ForecastBatch of forecast points.
             
-            return points
+        Raises:
+            DataFetchError: If unable to fetch any data.
+        """
+        if not force_refresh:
+            with self._cache_lock:
+                cached = self._cached_data_locked(allow_stale=True)
+            if cached is not None:
+                return cached
+        
+        return self._fetch_shared(force_refresh=force_refresh)
     
     def calculate_confidence_metrics(
         self, 
-        points: list[ForecastPoint]
+        points: ForecastBatch | list[ForecastPoint]
     ) -> ConfidenceMetrics:
         """Calculate statistical confidence metrics for a set of forecasts.
         
@@ -294,22 +744,21 @@ class PredictionEngine:
                 sample_size=0, source_diversity=0
             )
         
-        years = [p.median_year for p in points]
-        sources = {p.source for p in points}
-        
-        mean_year = statistics.mean(years)
-        median_year = statistics.median(years)
-        std_dev = statistics.stdev(years) if len(years) > 1 else 0.0
+        points = ForecastBatch.coerce(points)
+        sources = points.source_names()
+        summary = summarize(points.year_values())
         
         return ConfidenceMetrics(
-            mean_year=mean_year,
-            median_year=median_year,
-            std_deviation=std_dev,
+            mean_year=summary.mean,
+            median_year=summary.median,
+            std_deviation=summary.stdev,
             sample_size=len(points),
             source_diversity=len(sources)
         )
     
-    def _determine_consensus_type(self, points: list[ForecastPoint]) -> ConsensusType:
+    def _determine_consensus_type(
+        self, points: ForecastBatch | list[ForecastPoint]
+    ) -> ConsensusType:
         """Determine the type of consensus based on data sources.
         
         Args:
@@ -318,8 +767,11 @@ class PredictionEngine:
         Returns:
             ConsensusType enum value.
         """
-        sources = {p.source for p in points}
-        
+        return self._consensus_for_sources(ForecastBatch.coerce(points).source_names())
+    
+    @staticmethod
+    def _consensus_for_sources(sources: set[str]) -> ConsensusType:
+        """Determine the type of consensus from a set of source names."""
         if len(sources) == 0:
             return ConsensusType.SINGLE_SOURCE
         elif len(sources) == 1:
@@ -363,32 +815,19 @@ class PredictionEngine:
         month = max(1, min(12, month))
         return f"{yr}-{month:02d}-01"
     
-    def generate_prediction(self, force_refresh: bool = False) -> Prediction:
-        """Generate a comprehensive prediction from forecast data.
+    @staticmethod
+    def _with_fallbacks(
+        points: ForecastBatch, classified: dict[str, ForecastBatch]
+    ) -> tuple[ForecastBatch, ForecastBatch, ForecastBatch]:
+        """Return the AGI, ASI and singularity points with empty categories filled.
         
-        Args:
-            force_refresh: If True, bypass cache and fetch fresh data.
-            
-        Returns:
-            Prediction object with all timeline estimates.
-            
-        Raises:
-            DataFetchError: If unable to fetch data.
-            DataValidationError: If data validation fails.
+        An empty AGI category falls back to all points; empty ASI and
+        singularity categories fall back to the AGI points.
         """
-        logger.info("Generating new prediction")
-        
-        # Fetch and validate data
-        raw_points = self.fetch_data(force_refresh=force_refresh)
-        points = self._validate_data(raw_points)
-        
-        # Classify points by category
-        classified = ForecastClassifier.classify(points)
         agi_points = classified["agi"]
         asi_points = classified["asi"]
         sing_points = classified["singularity"]
         
-        # Apply fallbacks for empty categories
         if not agi_points:
             agi_points = points
             logger.debug("Using all points as AGI fallback")
@@ -399,28 +838,98 @@ class PredictionEngine:
             sing_points = agi_points
             logger.debug("Using AGI points as singularity fallback")
         
+        return agi_points, asi_points, sing_points
+    
+    def _analyze(
+        self,
+        points: ForecastBatch,
+        classified: Optional[dict[str, ForecastBatch]] = None,
+        aggregation: Optional[dict[str, str]] = None,
+    ) -> PredictionAnalysis:
+        """Classify validated points and derive the prediction and metrics.
+        
+        Args:
+            points: Validated forecast points.
+            classified: Optional precomputed classification of ``points``.
+            aggregation: Optional per-category strategies; defaults to the
+                engine's.
+            
+        Returns:
+            PredictionAnalysis holding every intermediate result.
+        """
+        if classified is None:
+            classified = self.classifier.classify(points)
+        if aggregation is None:
+            aggregation = self._aggregation
+        
+        # Metrics per list, so fallback categories reuse already computed ones
+        computed: dict[int, ConfidenceMetrics] = {}
+        
+        def metrics_for(category_points: ForecastBatch) -> ConfidenceMetrics:
+            key = id(category_points)
+            if key not in computed:
+                computed[key] = self.calculate_confidence_metrics(category_points)
+            return computed[key]
+        
+        metrics = {category: metrics_for(pts) for category, pts in classified.items()}
+        
+        agi_points, asi_points, sing_points = self._with_fallbacks(points, classified)
+        
         # Calculate aggregated years
-        agi_year = aggregate_forecasts(agi_points)
-        asi_year = aggregate_forecasts(asi_points)
-        sing_year = aggregate_forecasts(sing_points)
+        agi_year = aggregate_forecasts(agi_points, aggregation["agi"])
+        asi_year = aggregate_forecasts(asi_points, aggregation["asi"])
+        sing_year = aggregate_forecasts(sing_points, aggregation["singularity"])
         
+        prediction = self._build_prediction(
+            agi_year, asi_year, sing_year,
+            agi_metrics=metrics_for(agi_points),
+            sing_metrics=metrics_for(sing_points),
+            agi_sources=agi_points.source_names(),
+        )
+        
+        return PredictionAnalysis(
+            points=points,
+            classified=classified,
+            metrics=metrics,
+            prediction=prediction,
+        )
+    
+    def _build_prediction(
+        self,
+        agi_year: float,
+        asi_year: float,
+        sing_year: float,
+        agi_metrics: ConfidenceMetrics,
+        sing_metrics: ConfidenceMetrics,
+        agi_sources: set[str],
+    ) -> Prediction:
+        """Turn aggregated years and metrics into a Prediction.
+        
+        Args:
+            agi_year: Aggregated AGI year.
+            asi_year: Aggregated ASI year.
+            sing_year: Aggregated singularity year.
+            agi_metrics: Confidence metrics of the AGI points.
+            sing_metrics: Confidence metrics of the singularity points.
+            agi_sources: Source names among the AGI points.
+            
+        Returns:
+            Prediction with ordering constraints applied.
+        """
         # Ensure logical ordering: AGI <= ASI <= Singularity
         if asi_year <= agi_year:
-            asi_year = agi_year + 5
-            logger.debug(f"Adjusted ASI year to {asi_year} (AGI + 5)")
+            asi_year = agi_year + MIN_ASI_GAP_YEARS
+            logger.debug(f"Adjusted ASI year to {asi_year} (AGI + {MIN_ASI_GAP_YEARS})")
         if sing_year <= asi_year:
             sing_year = asi_year + 15
             logger.debug(f"Adjusted singularity year to {sing_year} (ASI + 15)")
         
-        # Calculate metrics and probabilities
-        agi_metrics = self.calculate_confidence_metrics(agi_points)
-        sing_metrics = self.calculate_confidence_metrics(sing_points)
-        
+        # Calculate probabilities
         agi_prob = self._calculate_probability(agi_metrics)
         sing_prob = self._calculate_probability(sing_metrics)
         
         # Determine consensus type and takeoff scenario
-        consensus_type = self._determine_consensus_type(agi_points)
+        consensus_type = self._consensus_for_sources(agi_sources)
         takeoff_scenario = TakeoffScenario.from_year_gap(asi_year - agi_year)
         
         prediction = Prediction(
@@ -441,27 +950,349 @@ class PredictionEngine:
         
         return prediction
     
-    def get_detailed_analysis(self, force_refresh: bool = False) -> dict:
-        """Get detailed analysis including raw data and metrics.
+    @staticmethod
+    def _metrics_from_stats(stats: RunningStats) -> ConfidenceMetrics:
+        """ConfidenceMetrics from running statistics."""
+        if not stats.count:
+            return ConfidenceMetrics(
+                mean_year=0, median_year=0, std_deviation=0,
+                sample_size=0, source_diversity=0
+            )
+        return ConfidenceMetrics(
+            mean_year=stats.mean,
+            median_year=stats.median,
+            std_deviation=stats.stdev,
+            sample_size=stats.count,
+            source_diversity=len(stats.source_counts),
+        )
+    
+    def _analyze_incremental(self, points: ForecastBatch) -> PredictionAnalysis:
+        """Incremental counterpart of ``_analyze``.
+        
+        Only forecasts that changed since the previous call are classified
+        and folded into the running statistics. ``classified`` is left empty
+        in the returned analysis since no per-category batches are built.
+        
+        Args:
+            points: Validated forecast points.
+            
+        Returns:
+            PredictionAnalysis holding the prediction and metrics.
+        """
+        assert self._aggregator is not None
+        with self._aggregator_lock:
+            # Cached categories are stale once the classifier rules change
+            if self.classifier.rules is not self._aggregator_rules:
+                self._aggregator.reset(self.classifier.categorize)
+                self._aggregator_rules = self.classifier.rules
+            
+            delta = self._aggregator.sync(points)
+            logger.debug(
+                f"Applied deltas: +{delta.added} -{delta.removed} ~{delta.updated}"
+            )
+            
+            stats = {c: self._aggregator.stats(c) for c in ForecastClassifier.BASE_CATEGORIES}
+            metrics = {c: self._metrics_from_stats(st) for c, st in stats.items()}
+            
+            agi_stats = stats["agi"]
+            asi_stats = stats["asi"]
+            sing_stats = stats["singularity"]
+            
+            # Apply fallbacks for empty categories
+            if not agi_stats.count:
+                agi_stats = self._aggregator.stats(ALL)
+            if not asi_stats.count:
+                asi_stats = agi_stats
+            if not sing_stats.count:
+                sing_stats = agi_stats
+            
+            def year_of(st: RunningStats) -> float:
+                return st.weighted_mean if st.count else aggregate_forecasts([])
+            
+            prediction = self._build_prediction(
+                year_of(agi_stats), year_of(asi_stats), year_of(sing_stats),
+                agi_metrics=self._metrics_from_stats(agi_stats),
+                sing_metrics=self._metrics_from_stats(sing_stats),
+                agi_sources=agi_stats.sources,
+            )
+        
+        return PredictionAnalysis(
+            points=points,
+            classified={},
+            metrics=metrics,
+            prediction=prediction,
+        )
+    
+    def analyze(
+        self,
+        force_refresh: bool = False,
+        points: Optional[ForecastBatch | list[ForecastPoint]] = None,
+    ) -> PredictionAnalysis:
+        """Fetch, validate and classify once, producing all derived results.
         
         Args:
             force_refresh: If True, bypass cache and fetch fresh data.
+            points: Optional raw points to analyze instead of fetching.
             
         Returns:
-            Dictionary with prediction, metrics, and source breakdown.
+            PredictionAnalysis with the prediction and per-category metrics.
+            
+        Raises:
+            DataFetchError: If unable to fetch data.
+            DataValidationError: If data validation fails.
         """
-        raw_points = self.fetch_data(force_refresh=force_refresh)
+        raw_points = points if points is not None else self.fetch_data(force_refresh=force_refresh)
         points = self._validate_data(raw_points)
-        classified = ForecastClassifier.classify(points)
+        if self._aggregator is not None:
+            return self._analyze_incremental(points)
+        return self._analyze(points)
+    
+    def generate_prediction(self, force_refresh: bool = False) -> Prediction:
+        """Generate a comprehensive prediction from forecast data.
+        
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh data.
+            
+        Returns:
+            Prediction object with all timeline estimates.
+            
+        Raises:
+            DataFetchError: If unable to fetch data.
+            DataValidationError: If data validation fails.
+        """
+        logger.info("Generating new prediction")
+        return self.analyze(force_refresh=force_refresh).prediction
+    
+    def _category_rows(self, points: ForecastBatch) -> dict[str, Sequence[int]]:
+        """Row indices of each category, from one classification pass."""
+        rows: dict[str, list[int]] = {c: [] for c in ForecastClassifier.BASE_CATEGORIES}
+        categorize = self.classifier.categorize
+        for i, question in enumerate(points.questions()):
+            rows.setdefault(categorize(question), []).append(i)
+        
+        np = get_numpy()
+        if np is not None:
+            return {c: np.asarray(r, dtype=np.intp) for c, r in rows.items()}
+        return rows
+    
+    def _evaluate_config(
+        self,
+        points: ForecastBatch,
+        category_rows: dict[str, Sequence[int]],
+        config: PredictionConfig,
+    ) -> SweepResult:
+        """Evaluate one configuration over shared, pre-classified points."""
+        aggregation = self._resolve_aggregation(config.aggregation)
+        mask = points.valid_mask(
+            self.MIN_VALID_YEAR if config.min_year is None else config.min_year,
+            self.MAX_VALID_YEAR if config.max_year is None else config.max_year,
+            self.MIN_FORECASTERS if config.min_forecasters is None else config.min_forecasters,
+        )
+        if config.sources is not None:
+            source_mask = points.source_mask(config.sources)
+            np = get_numpy()
+            if np is not None:
+                mask = mask & source_mask
+            else:
+                mask = [a and b for a, b in zip(mask, source_mask)]
+        
+        valid_points = points.filter(mask)
+        if len(valid_points) < config.min_data_points:
+            return SweepResult(config, error=DataValidationError(
+                f"Insufficient valid data: got {len(valid_points)}, "
+                f"need {config.min_data_points}"
+            ))
+        
+        np = get_numpy()
+        if np is not None:
+            classified = {c: points.take(r[mask[r]]) for c, r in category_rows.items()}
+        else:
+            classified = {c: points.take([i for i in r if mask[i]])
+                          for c, r in category_rows.items()}
+        
+        analysis = self._analyze(valid_points, classified, aggregation)
+        return SweepResult(config, prediction=analysis.prediction, metrics=analysis.metrics)
+    
+    def generate_predictions(
+        self,
+        configs: Iterable[PredictionConfig],
+        points: Optional[ForecastBatch | list[ForecastPoint]] = None,
+        force_refresh: bool = False,
+        processes: Optional[int] = None,
+    ) -> list[SweepResult]:
+        """Generate one prediction per configuration from a single dataset.
+        
+        The data is fetched (or taken from ``points``) and classified once;
+        each configuration then only applies its own validation mask, source
+        subset and aggregation over the shared columns. A configuration
+        without enough valid data yields a result holding the
+        DataValidationError instead of failing the whole sweep.
+        
+        Args:
+            configs: Configurations to evaluate.
+            points: Optional raw points to use instead of fetching.
+            force_refresh: If True and ``points`` is not given, bypass the
+                cache and fetch fresh data.
+            processes: Worker processes to spread configurations over;
+                None or 1 evaluates them in this process.
+            
+        Returns:
+            One SweepResult per configuration, in order.
+            
+        Raises:
+            DataFetchError: If unable to fetch data.
+            ValueError: If a configuration names an unknown aggregation.
+        """
+        configs = list(configs)
+        if points is None:
+            points = self.fetch_data(force_refresh=force_refresh)
+        points = ForecastBatch.coerce(points)
+        category_rows = self._category_rows(points)
+        
+        if processes and processes > 1 and len(configs) > 1:
+            chunksize = -(-len(configs) // processes)
+            # Imported on demand to keep engine start-up light for headless tools
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                return list(pool.map(
+                    _evaluate_config_in_worker,
+                    repeat(type(self)), repeat(points), repeat(category_rows), configs,
+                    chunksize=chunksize,
+                ))
+        
+        return [self._evaluate_config(points, category_rows, config) for config in configs]
+    
+    def confidence_intervals(
+        self,
+        analysis: PredictionAnalysis,
+        resamples: int = DEFAULT_RESAMPLES,
+        level: float = DEFAULT_LEVEL,
+        seed: int = 0,
+        processes: Optional[int] = None,
+    ) -> dict[str, ConfidenceInterval]:
+        """Bootstrap intervals on the aggregated AGI, ASI and singularity years.
+        
+        Each category is resampled with the same fallbacks and aggregation
+        strategy as the prediction. Intervals describe the aggregated years
+        before the ASI/singularity ordering adjustments.
+        
+        Args:
+            analysis: Result of ``analyze``.
+            resamples: Bootstrap resamples per category.
+            level: Two-sided coverage, e.g. 0.95.
+            seed: Seed making the intervals reproducible.
+            processes: Worker processes for large resample counts.
+            
+        Returns:
+            Mapping of category name to ConfidenceInterval. Categories with
+            no points even after fallbacks (an empty analysis) are omitted.
+        """
+        # Incremental analyses skip the batch classification pass
+        classified = analysis.classified or self.classifier.classify(analysis.points)
+        category_points = zip(
+            ForecastClassifier.BASE_CATEGORIES,
+            self._with_fallbacks(analysis.points, classified),
+        )
+        
+        return {
+            category: bootstrap_interval(
+                pts.year_values(),
+                pts.forecaster_values(),
+                pts.timestamp_values(),
+                strategy=self._aggregation[category],
+                resamples=resamples,
+                level=level,
+                seed=seed,
+                processes=processes,
+            )
+            for category, pts in category_points
+            if pts
+        }
+    
+    def simulate_scenarios(
+        self,
+        analysis: PredictionAnalysis,
+        draws: int = DEFAULT_DRAWS,
+        seed: int = 0,
+        processes: Optional[int] = None,
+    ) -> ScenarioMix:
+        """Monte Carlo mix of takeoff scenarios for an analysis.
+        
+        Fits a year distribution to the AGI and ASI points (with the same
+        fallbacks as the prediction) and simulates paired draws, replacing
+        the single ``TakeoffScenario.from_year_gap`` threshold on the point
+        estimates with a probability for each scenario.
+        
+        Args:
+            analysis: Result of ``analyze``.
+            draws: Number of simulated (AGI, ASI) pairs.
+            seed: Seed making the simulation reproducible.
+            processes: Worker processes for large draw counts.
+            
+        Returns:
+            ScenarioMix with rapid/moderate/slow probabilities.
+            
+        Raises:
+            DataValidationError: If the analysis has no points to fit.
+        """
+        if not analysis.points:
+            raise DataValidationError("No forecast points to simulate scenarios from")
+        classified = analysis.classified or self.classifier.classify(analysis.points)
+        agi_points, asi_points, _ = self._with_fallbacks(analysis.points, classified)
+        # A shared origin keeps both distributions on the same support
+        origin = min(
+            min(agi_points.year_values()), min(asi_points.year_values()), self.MIN_VALID_YEAR
+        ) - 1.0
+        
+        return simulate_scenarios(
+            YearDistribution.fit(agi_points.year_values(), agi_points.forecaster_values(), origin),
+            YearDistribution.fit(asi_points.year_values(), asi_points.forecaster_values(), origin),
+            draws=draws,
+            seed=seed,
+            processes=processes,
+        )
+    
+    def get_detailed_analysis(
+        self,
+        force_refresh: bool = False,
+        resamples: int = DEFAULT_RESAMPLES,
+        seed: int = 0,
+        processes: Optional[int] = None,
+    ) -> dict:
+        """Get detailed analysis including raw data, metrics and intervals.
+        
+        The prediction and all metrics come from a single fetch and
+        classification pass.
+        
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh data.
+            resamples: Bootstrap resamples per category; 0 skips intervals.
+            seed: Seed making the bootstrap intervals reproducible.
+            processes: Worker processes for large resample counts.
+            
+        Returns:
+            Dictionary with prediction, metrics, 95% bootstrap intervals
+            and source breakdown.
+        """
+        analysis = self.analyze(force_refresh=force_refresh)
+        points = analysis.points
+        intervals = (
+            self.confidence_intervals(
+                analysis, resamples=resamples, seed=seed, processes=processes
+            )
+            if resamples else {}
+        )
         
         return {
-            "prediction": self.generate_prediction(force_refresh=False),
+            "prediction": analysis.prediction,
             "total_data_points": len(points),
-            "sources": list({p.source for p in points}),
-            "agi_metrics": self.calculate_confidence_metrics(classified["agi"]),
-            "asi_metrics": self.calculate_confidence_metrics(classified["asi"]),
-            "singularity_metrics": self.calculate_confidence_metrics(classified["singularity"]),
-            "raw_forecasts": points,
+            "sources": list(points.source_names()),
+            "agi_metrics": analysis.metrics["agi"],
+            "asi_metrics": analysis.metrics["asi"],
+            "singularity_metrics": analysis.metrics["singularity"],
+            "intervals": intervals,
+            "raw_forecasts": points.to_points(),
         }
     
     def clear_cache(self) -> None:
@@ -470,3 +1301,12 @@ class PredictionEngine:
             self._cache = None
             logger.debug("Cache cleared")
 
+
+def _evaluate_config_in_worker(
+    engine_cls: type[PredictionEngine],
+    points: ForecastBatch,
+    category_rows: dict[str, Sequence[int]],
+    config: PredictionConfig,
+) -> SweepResult:
+    """Process-pool entry point for ``PredictionEngine.generate_predictions``."""
+    return engine_cls()._evaluate_config(points, category_rows, config)
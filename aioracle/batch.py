@@ -0,0 +1,290 @@
+"""Columnar container for forecast points.
+
+``ForecastBatch`` stores forecasts as parallel typed arrays instead of one
+``ForecastPoint`` instance per forecast: years and forecaster counts are
+packed machine values, source names are interned once and referenced by id,
+and question/URL text lives in a single buffer addressed by offsets. Numeric
+columns can be viewed as NumPy arrays without copying, so validation and
+filtering work on masks rather than rebuilding lists.
+
+Batches are append-only while being built and treated as read-only once
+handed to the engine; NumPy views returned by ``year_values`` and
+``forecaster_values`` pin the underlying buffers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+from .models import ForecastPoint
+from .stats import get_numpy
+
+
+def _gather(values: array, indices: Sequence[int]) -> array:
+    """Return ``values[indices]`` as a new array of the same type."""
+    np = get_numpy()
+    if np is not None and len(indices):
+        idx = np.asarray(indices, dtype=np.intp)
+        view = np.frombuffer(values, dtype=np.dtype(values.typecode))
+        return array(values.typecode, view[idx].tobytes())
+    return array(values.typecode, (values[i] for i in indices))
+
+
+class _StringColumn:
+    """Append-only string column: one shared text buffer plus (start, end) spans.
+
+    ``take`` shares the parent's buffer and only gathers spans, so filtering
+    never copies question text.
+    """
+
+    __slots__ = ("_text", "_pending", "_length", "starts", "ends")
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pending: list[str] = []
+        self._length = 0
+        self.starts = array("q")
+        self.ends = array("q")
+
+    def append(self, value: str) -> None:
+        self._pending.append(value)
+        self.starts.append(self._length)
+        self._length += len(value)
+        self.ends.append(self._length)
+
+    def _flush(self) -> str:
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending.clear()
+        return self._text
+
+    def __getitem__(self, index: int) -> str:
+        text = self._flush()
+        return text[self.starts[index]:self.ends[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self._flush()
+        for start, end in zip(self.starts, self.ends):
+            yield text[start:end]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def take(self, indices: Sequence[int]) -> "_StringColumn":
+        out = _StringColumn()
+        out._text = self._flush()
+        out._length = len(out._text)
+        out.starts = _gather(self.starts, indices)
+        out.ends = _gather(self.ends, indices)
+        return out
+
+
+class ForecastBatch:
+    """Columnar batch of forecasts.
+
+    Example:
+        >>> batch = ForecastBatch()
+        >>> batch.append("Metaculus", "When will AGI arrive?", 2033.5, 1200)
+        >>> batch.years[0], batch.source(0)
+        (2033.5, 'Metaculus')
+    """
+
+    __slots__ = ("years", "forecasters", "updated_at", "source_ids", "sources",
+                 "_source_index", "_questions", "_urls")
+
+    def __init__(self) -> None:
+        self.years = array("d")
+        self.forecasters = array("q")
+        # Unix timestamps of the last upstream update; NaN when unknown
+        self.updated_at = array("d")
+        self.source_ids = array("I")
+        # Interned source names; source_ids index into this list
+        self.sources: list[str] = []
+        self._source_index: dict[str, int] = {}
+        self._questions = _StringColumn()
+        self._urls = _StringColumn()
+
+    @classmethod
+    def from_points(cls, points: Iterable[ForecastPoint]) -> "ForecastBatch":
+        """Build a batch from ForecastPoint instances."""
+        batch = cls()
+        batch.extend(points)
+        return batch
+
+    @classmethod
+    def coerce(
+        cls, data: Union["ForecastBatch", Iterable[ForecastPoint]]
+    ) -> "ForecastBatch":
+        """Return ``data`` as a batch, converting a point sequence if needed."""
+        if isinstance(data, cls):
+            return data
+        return cls.from_points(data)
+
+    def _source_id(self, source: str) -> int:
+        source_id = self._source_index.get(source)
+        if source_id is None:
+            source_id = len(self.sources)
+            self.sources.append(source)
+            self._source_index[source] = source_id
+        return source_id
+
+    def append(
+        self,
+        source: str,
+        question: str,
+        median_year: float,
+        num_forecasters: int,
+        url: str = "",
+        updated_at: Optional[float] = None,
+    ) -> None:
+        """Append one forecast."""
+        self.years.append(float(median_year))
+        self.forecasters.append(int(num_forecasters or 0))
+        self.updated_at.append(math.nan if updated_at is None else float(updated_at))
+        self.source_ids.append(self._source_id(source))
+        self._questions.append(question)
+        self._urls.append(url)
+
+    def append_point(self, point: ForecastPoint) -> None:
+        """Append a ForecastPoint."""
+        self.append(point.source, point.question, point.median_year,
+                    point.num_forecasters, point.url, point.updated_at)
+
+    def extend(self, points: Iterable[ForecastPoint]) -> None:
+        """Append several ForecastPoints."""
+        for point in points:
+            self.append_point(point)
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def __repr__(self) -> str:
+        return f"ForecastBatch({len(self)} points, sources={sorted(self.source_names())})"
+
+    def __iter__(self) -> Iterator[ForecastPoint]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> ForecastPoint:
+        return ForecastPoint(
+            source=self.source(index),
+            question=self.question(index),
+            median_year=self.years[index],
+            num_forecasters=self.forecasters[index],
+            url=self.url(index),
+            updated_at=self.timestamp(index),
+        )
+
+    def source(self, index: int) -> str:
+        return self.sources[self.source_ids[index]]
+
+    def timestamp(self, index: int) -> Optional[float]:
+        value = self.updated_at[index]
+        return None if math.isnan(value) else value
+
+    def question(self, index: int) -> str:
+        return self._questions[index]
+
+    def url(self, index: int) -> str:
+        return self._urls[index]
+
+    def questions(self) -> Iterator[str]:
+        """Iterate over question texts in order."""
+        return iter(self._questions)
+
+    def source_names(self) -> set[str]:
+        """Distinct sources present in the batch."""
+        return {self.sources[i] for i in set(self.source_ids)}
+
+    def fingerprint(self) -> str:
+        """Hash of every row's source, question, URL, year and forecaster count.
+
+        Update timestamps are left out so upstream activity that does not
+        change any forecast keeps the same fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.years.tobytes())
+        digest.update(self.forecasters.tobytes())
+        digest.update("\0".join(self.sources[i] for i in self.source_ids).encode())
+        digest.update("\0".join(self._questions).encode())
+        digest.update("\0".join(self._urls).encode())
+        return digest.hexdigest()
+
+    def to_points(self) -> list[ForecastPoint]:
+        """Materialize the batch as ForecastPoint instances."""
+        return list(self)
+
+    def take(self, indices: Sequence[int]) -> "ForecastBatch":
+        """Return a new batch with the rows at ``indices``, in that order."""
+        out = ForecastBatch()
+        out.years = _gather(self.years, indices)
+        out.forecasters = _gather(self.forecasters, indices)
+        out.updated_at = _gather(self.updated_at, indices)
+        out.source_ids = _gather(self.source_ids, indices)
+        # Sources keep their interned ids, so copy the lookup tables as-is
+        out.sources = list(self.sources)
+        out._source_index = dict(self._source_index)
+        out._questions = self._questions.take(indices)
+        out._urls = self._urls.take(indices)
+        return out
+
+    def filter(self, mask: Sequence[bool]) -> "ForecastBatch":
+        """Return a new batch with the rows where ``mask`` is true."""
+        np = get_numpy()
+        if np is not None:
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+        return self.take([i for i, keep in enumerate(mask) if keep])
+
+    def year_values(self):
+        """Years as a NumPy array view when available, else the raw array."""
+        np = get_numpy()
+        if np is not None:
+            return np.frombuffer(self.years, dtype=np.float64)
+        return self.years
+
+    def forecaster_values(self):
+        """Forecaster counts as a NumPy array view when available."""
+        np = get_numpy()
+        if np is not None:
+            return np.frombuffer(self.forecasters, dtype=np.int64)
+        return self.forecasters
+
+    def timestamp_values(self):
+        """Update timestamps (NaN when unknown) as a NumPy view when available."""
+        np = get_numpy()
+        if np is not None:
+            return np.frombuffer(self.updated_at, dtype=np.float64)
+        return self.updated_at
+
+    def valid_mask(self, min_year: float, max_year: float,
+                   min_forecasters: Optional[int] = None) -> Sequence[bool]:
+        """Mask of rows with ``min_year <= year <= max_year``.
+
+        Optionally also requires at least ``min_forecasters`` forecasters.
+        """
+        np = get_numpy()
+        if np is not None:
+            years = self.year_values()
+            mask = (years >= min_year) & (years <= max_year)
+            if min_forecasters is not None:
+                mask &= self.forecaster_values() >= min_forecasters
+            return mask
+
+        if min_forecasters is None:
+            return [min_year <= y <= max_year for y in self.years]
+        return [
+            min_year <= y <= max_year and n >= min_forecasters
+            for y, n in zip(self.years, self.forecasters)
+        ]
+
+    def source_mask(self, sources: Iterable[str]) -> Sequence[bool]:
+        """Mask of rows whose source is one of ``sources``."""
+        ids = {self._source_index[s] for s in sources if s in self._source_index}
+        np = get_numpy()
+        if np is not None:
+            source_ids = np.frombuffer(self.source_ids, dtype=np.dtype(self.source_ids.typecode))
+            return np.isin(source_ids, list(ids))
+        return [i in ids for i in self.source_ids]
@@ -0,0 +1,199 @@
+"""Micro-benchmarks for aggregation strategies and the history database.
+
+Run with ``python -m aioracle.bench`` to print per-strategy throughput on
+synthetic datasets of 1k to 1M points, or ``python -m aioracle.bench db`` to
+compare insert throughput and concurrent read latency between SQLite's stock
+settings and the tuned ``DatabaseManager`` profile.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Optional, Sequence
+
+from .aggregation import available_strategies, get_strategy
+from .db import DEFAULT_PROFILE, LEGACY_PROFILE, DatabaseManager, PerformanceProfile
+from .models import Prediction
+from .stats import forecaster_weights
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def synthetic_columns(n: int, seed: int = 0) -> tuple[array, array, array]:
+    """Random (years, num_forecasters, timestamps) columns shaped like real data.
+
+    Years are log-normally skewed into the future, forecaster counts are
+    heavy-tailed and roughly one timestamp in five is unknown (NaN).
+    """
+    rng = random.Random(seed)
+    now = time.time()
+    years = array("d", (2025 + min(175.0, rng.lognormvariate(2.5, 0.7)) for _ in range(n)))
+    forecasters = array("q", (int(rng.paretovariate(1.2)) for _ in range(n)))
+    timestamps = array("d", (
+        float("nan") if rng.random() < 0.2 else now - rng.uniform(0, 730 * 86400)
+        for _ in range(n)
+    ))
+    return years, forecasters, timestamps
+
+
+def benchmark_aggregation(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeats: int = 5,
+    seed: int = 0,
+) -> dict[str, dict[int, float]]:
+    """Time every registered strategy on synthetic data.
+
+    Args:
+        sizes: Dataset sizes to benchmark.
+        repeats: Timed runs per strategy and size; the best run is kept.
+        seed: Seed for the synthetic data.
+
+    Returns:
+        Mapping of strategy name to {size: points per second}.
+    """
+    results: dict[str, dict[int, float]] = {name: {} for name in available_strategies()}
+    for n in sizes:
+        years, forecasters, timestamps = synthetic_columns(n, seed)
+        weights = forecaster_weights(forecasters)
+        for name in results:
+            strategy = get_strategy(name)
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                strategy(years, weights, timestamps)
+                best = min(best, time.perf_counter() - start)
+            results[name][n] = n / best if best else float("inf")
+    return results
+
+
+def _format_rate(rate: float) -> str:
+    for unit, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if rate >= scale:
+            return f"{rate / scale:.1f}{unit}"
+    return f"{rate:.0f}"
+
+
+def format_results(results: dict[str, dict[int, float]], sizes: Sequence[int]) -> str:
+    """Render ``benchmark_aggregation`` results as a points/s table."""
+    lines = ["points/s".ljust(18) + "".join(f"{n:>10,}" for n in sizes)]
+    for name, rates in results.items():
+        lines.append(name.ljust(18) + "".join(f"{_format_rate(rates[n]):>10}" for n in sizes))
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class DatabaseBenchmark:
+    """Insert throughput and read latency under one PerformanceProfile."""
+    profile: str
+    inserts_per_second: float
+    read_p50_ms: float
+    read_p95_ms: float
+    reads: int
+
+
+def _sample_prediction(i: int) -> Prediction:
+    return Prediction(
+        timestamp=f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.{i:06d}",
+        agi_date="2033-06-01", agi_type="Crowd + Expert Consensus", agi_prob=72.5,
+        asi_date="2038-06-01", asi_context="Moderate Transition",
+        singularity_date="2053-06-01", singularity_prob=70.0,
+    )
+
+
+def benchmark_database(
+    inserts: int = 500,
+    readers: int = 4,
+    read_seconds: float = 1.0,
+    profiles: Optional[dict[str, PerformanceProfile]] = None,
+) -> list[DatabaseBenchmark]:
+    """Time committed inserts, then reads racing a committing writer.
+
+    Each profile gets a fresh database file in a temporary directory.
+
+    Args:
+        inserts: Rows inserted (one commit each) for the throughput phase.
+        readers: Reader threads, each with its own connection, querying the
+            latest prediction while the writer keeps inserting.
+        read_seconds: Duration of the concurrent read phase.
+        profiles: Named profiles to compare; defaults to SQLite's stock
+            settings ("legacy") versus ``DEFAULT_PROFILE`` ("tuned").
+    """
+    if profiles is None:
+        profiles = {"legacy": LEGACY_PROFILE, "tuned": DEFAULT_PROFILE}
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, profile in profiles.items():
+            path = os.path.join(tmp, f"{name}.db")
+            db = DatabaseManager(path, profile=profile)
+
+            start = time.perf_counter()
+            for i in range(inserts):
+                db.save_prediction(_sample_prediction(i))
+            insert_rate = inserts / (time.perf_counter() - start)
+
+            stop = Event()
+            latencies: list[float] = []
+            latencies_lock = Lock()
+
+            def read_loop() -> None:
+                reader = DatabaseManager(path, profile=profile)
+                local = []
+                while not stop.is_set():
+                    t = time.perf_counter()
+                    reader.get_latest_prediction()
+                    local.append(time.perf_counter() - t)
+                reader.close()
+                with latencies_lock:
+                    latencies.extend(local)
+
+            threads = [Thread(target=read_loop) for _ in range(readers)]
+            for thread in threads:
+                thread.start()
+            i = inserts
+            deadline = time.perf_counter() + read_seconds
+            while time.perf_counter() < deadline:
+                db.save_prediction(_sample_prediction(i))
+                i += 1
+            stop.set()
+            for thread in threads:
+                thread.join()
+            db.close()
+
+            latencies.sort()
+            results.append(DatabaseBenchmark(
+                profile=name,
+                inserts_per_second=insert_rate,
+                read_p50_ms=statistics.median(latencies) * 1000 if latencies else 0.0,
+                read_p95_ms=latencies[int(0.95 * (len(latencies) - 1))] * 1000 if latencies else 0.0,
+                reads=len(latencies),
+            ))
+    return results
+
+
+def format_database_results(results: Sequence[DatabaseBenchmark]) -> str:
+    """Render ``benchmark_database`` results as a table."""
+    lines = [f"{'profile':<10}{'inserts/s':>12}{'read p50 ms':>14}{'read p95 ms':>14}{'reads':>10}"]
+    for r in results:
+        lines.append(f"{r.profile:<10}{r.inserts_per_second:>12,.0f}"
+                     f"{r.read_p50_ms:>14.3f}{r.read_p95_ms:>14.3f}{r.reads:>10,}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["db"]:
+        print(format_database_results(benchmark_database()))
+    else:
+        print(format_results(benchmark_aggregation(), DEFAULT_SIZES))
+
+
+if __name__ == "__main__":
+    main()
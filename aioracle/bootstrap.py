@@ -0,0 +1,236 @@
+"""Bootstrap confidence intervals for aggregated forecast years.
+
+Resamples forecast points with replacement and re-aggregates each resample.
+With NumPy every resample in a chunk is drawn as one index matrix and
+aggregated row-wise in a single vectorized pass; chunks can be spread over a
+process pool for large resample counts. Chunk seeds are spawned from one
+``SeedSequence``, so results are reproducible for a given seed regardless of
+how many processes are used. Without NumPy a seeded pure-Python loop is used.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from .aggregation import (
+    DEFAULT_STRATEGY,
+    LOG_ODDS_WINDOW,
+    RECENCY_HALF_LIFE_DAYS,
+    TRIM_FRACTION,
+    get_strategy,
+)
+from .stats import forecaster_weights, get_numpy
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_LEVEL = 0.95
+
+# Upper bound on resample-matrix elements per chunk (~16 MB per float64 matrix)
+CHUNK_ELEMENTS = 2_000_000
+
+# Below this many matrix elements in total, process start-up costs more than it saves
+PARALLEL_MIN_ELEMENTS = 20_000_000
+
+
+@dataclass(frozen=True)
+class ConfidenceInterval:
+    """Bootstrap percentile interval around an aggregated year."""
+    estimate: float
+    lower: float
+    upper: float
+    level: float
+    resamples: int
+
+    @property
+    def width(self) -> float:
+        return self.upper - self.lower
+
+
+# Row-wise kernels: (years, weights, timestamps, now) matrices -> one value per row
+
+def _rows_weighted_mean(np, y, w):
+    totals = w.sum(axis=1)
+    safe = np.where(totals > 0, totals, 1.0)
+    return np.where(totals > 0, (y * w).sum(axis=1) / safe, y[:, 0])
+
+
+def _rows_sorted(np, y, w):
+    order = np.argsort(y, axis=1, kind="stable")
+    return np.take_along_axis(y, order, axis=1), np.take_along_axis(w, order, axis=1)
+
+
+def _kernel_weighted_mean(np, y, w, t, now):
+    return _rows_weighted_mean(np, y, w)
+
+
+def _kernel_weighted_median(np, y, w, t, now):
+    n = y.shape[1]
+    y, w = _rows_sorted(np, y, w)
+    cumulative = np.cumsum(w, axis=1)
+    totals = cumulative[:, -1:]
+    # Rows without usable weight fall back to equal weighting
+    cumulative = np.where(totals > 0, cumulative, np.arange(1, n + 1, dtype=np.float64))
+    targets = 0.5 * cumulative[:, -1:]
+    idx = np.minimum((cumulative < targets).sum(axis=1), n - 1)[:, None]
+    values = np.take_along_axis(y, idx, axis=1)
+    # Exactly on a boundary: midpoint with the next year, as weighted_median does
+    on_boundary = np.isclose(
+        np.take_along_axis(cumulative, idx, axis=1), targets, rtol=1e-12, atol=0.0
+    ) & (idx + 1 < n)
+    following = np.take_along_axis(y, np.minimum(idx + 1, n - 1), axis=1)
+    return np.where(on_boundary, (values + following) / 2, values)[:, 0]
+
+
+def _kernel_trimmed_mean(np, y, w, t, now):
+    y, w = _rows_sorted(np, y, w)
+    cumulative = np.cumsum(w, axis=1)
+    totals = cumulative[:, -1:]
+    lo, hi = TRIM_FRACTION * totals, (1 - TRIM_FRACTION) * totals
+    kept = np.clip(np.minimum(cumulative, hi) - np.maximum(cumulative - w, lo), 0, None)
+    kept_totals = kept.sum(axis=1)
+    safe = np.where(kept_totals > 0, kept_totals, 1.0)
+    return np.where(kept_totals > 0, (y * kept).sum(axis=1) / safe, np.median(y, axis=1))
+
+
+def _kernel_log_odds(np, y, w, t, now):
+    start, end = LOG_ODDS_WINDOW
+    span = end - start
+    p = np.clip((y - start) / span, 1e-6, 1 - 1e-6)
+    pooled = _rows_weighted_mean(np, np.log(p / (1 - p)), w)
+    return start + span / (1 + np.exp(-pooled))
+
+
+def _kernel_recency_weighted(np, y, w, t, now):
+    age = np.where(np.isnan(t), 0.0, np.maximum(now - t, 0.0))
+    return _rows_weighted_mean(np, y, w * np.exp2(-age / (RECENCY_HALF_LIFE_DAYS * 86400)))
+
+
+_KERNELS: dict[str, Callable] = {
+    "weighted_mean": _kernel_weighted_mean,
+    "weighted_median": _kernel_weighted_median,
+    "trimmed_mean": _kernel_trimmed_mean,
+    "log_odds": _kernel_log_odds,
+    "recency_weighted": _kernel_recency_weighted,
+}
+
+
+def _bootstrap_chunk(years, weights, timestamps, strategy: str, rows: int, seed_seq, now: float):
+    """Aggregate ``rows`` resamples drawn from ``seed_seq``. Runs in worker processes."""
+    np = get_numpy()
+    n = len(years)
+    rng = np.random.default_rng(seed_seq)
+    idx = rng.integers(0, n, size=(rows, n))
+    y, w, t = years[idx], weights[idx], timestamps[idx]
+
+    kernel = _KERNELS.get(strategy)
+    if kernel is not None:
+        return kernel(np, y, w, t, now)
+
+    # Strategies registered elsewhere have no row-wise kernel
+    func = get_strategy(strategy)
+    return np.array([func(y[i], w[i], t[i]) for i in range(rows)])
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile (0..1) of sorted values."""
+    pos = q * (len(sorted_values) - 1)
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def bootstrap_interval(
+    years: Sequence[float],
+    num_forecasters: Sequence[int],
+    timestamps: Optional[Sequence[float]] = None,
+    strategy: str = DEFAULT_STRATEGY,
+    resamples: int = DEFAULT_RESAMPLES,
+    level: float = DEFAULT_LEVEL,
+    seed: int = 0,
+    processes: Optional[int] = None,
+    now: Optional[float] = None,
+) -> ConfidenceInterval:
+    """Percentile bootstrap interval for an aggregated year.
+
+    Args:
+        years: Non-empty sequence of forecast years.
+        num_forecasters: Forecaster counts, turned into sqrt weights.
+        timestamps: Optional update timestamps (NaN when unknown).
+        strategy: Registered aggregation strategy to bootstrap.
+        resamples: Number of bootstrap resamples.
+        level: Two-sided coverage, e.g. 0.95.
+        seed: Seed making the resamples reproducible.
+        processes: Worker processes for large inputs; None or 1 runs in
+            this process. Ignored without NumPy.
+        now: Reference time for recency weighting; defaults to the current time.
+
+    Returns:
+        ConfidenceInterval whose estimate is the strategy applied to the
+        original (non-resampled) data.
+
+    Raises:
+        ValueError: On empty input, a non-positive resample count, a level
+            outside (0, 1) or an unknown strategy.
+    """
+    n = len(years)
+    if n == 0:
+        raise ValueError("bootstrap_interval() requires at least one year")
+    if resamples < 1:
+        raise ValueError("resamples must be positive")
+    if not 0.0 < level < 1.0:
+        raise ValueError("level must be within (0, 1)")
+
+    func = get_strategy(strategy)
+    if timestamps is None:
+        timestamps = [math.nan] * n
+    if now is None:
+        now = time.time()
+    weights = forecaster_weights(num_forecasters)
+    estimate = float(func(years, weights, timestamps))
+    tail = (1.0 - level) / 2
+
+    np = get_numpy()
+    if np is None:
+        rng = random.Random(seed)
+        population = range(n)
+        years, weights, timestamps = list(years), list(weights), list(timestamps)
+        estimates = []
+        for _ in range(resamples):
+            idx = rng.choices(population, k=n)
+            estimates.append(float(func(
+                [years[i] for i in idx], [weights[i] for i in idx], [timestamps[i] for i in idx]
+            )))
+        estimates.sort()
+        lower, upper = _percentile(estimates, tail), _percentile(estimates, 1.0 - tail)
+    else:
+        y = np.asarray(years, dtype=np.float64)
+        w = np.asarray(weights, dtype=np.float64)
+        t = np.asarray(timestamps, dtype=np.float64)
+
+        rows = max(1, min(resamples, CHUNK_ELEMENTS // n))
+        sizes = [rows] * (resamples // rows)
+        if resamples % rows:
+            sizes.append(resamples % rows)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = [(y, w, t, strategy, size, s, now) for size, s in zip(sizes, seeds)]
+
+        if processes and processes > 1 and len(sizes) > 1 and resamples * n >= PARALLEL_MIN_ELEMENTS:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunks = list(pool.map(_bootstrap_chunk, *zip(*args)))
+        else:
+            chunks = [_bootstrap_chunk(*a) for a in args]
+
+        lower, upper = np.quantile(np.concatenate(chunks), [tail, 1.0 - tail])
+
+    return ConfidenceInterval(
+        estimate=estimate,
+        lower=float(lower),
+        upper=float(upper),
+        level=level,
+        resamples=resamples,
+    )
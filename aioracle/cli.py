@@ -0,0 +1,273 @@
+"""Headless command-line interface: ``python -m aioracle``.
+
+Only the engine, scraper, database and model modules are imported, never
+PyQt6 or matplotlib, so the CLI starts quickly and runs on machines without
+a display (cron jobs, servers).
+
+Subcommands:
+    predict    Fetch forecasts, print a prediction and store it in history
+    history    Print stored predictions, newest first
+    export     Write stored predictions as CSV or JSON
+    daemon     Poll sources on an adaptive schedule, storing changed predictions
+    serve      Serve predictions, analysis and history as local HTTP/JSON
+    benchmark  Report aggregation throughput or database insert/read performance
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import signal
+import sys
+from dataclasses import asdict
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Sequence, TextIO
+
+from .backend import PredictionEngine, PredictionError
+from .daemon import MAX_INTERVAL, MIN_INTERVAL, PollingDaemon
+from .db import HISTORY_COLUMNS, DatabaseManager
+from .models import Prediction
+
+DEFAULT_DB = "ai_predictions.db"
+
+
+def _print_prediction(prediction: Prediction, out: TextIO) -> None:
+    print(f"Generated:    {prediction.timestamp}", file=out)
+    print(f"AGI:          {prediction.agi_date}  "
+          f"({prediction.agi_prob:.1f}%, {prediction.agi_type})", file=out)
+    print(f"ASI:          {prediction.asi_date}  ({prediction.asi_context})", file=out)
+    print(f"Singularity:  {prediction.singularity_date}  "
+          f"({prediction.singularity_prob:.1f}%)", file=out)
+
+
+def _cmd_predict(args: argparse.Namespace) -> int:
+    try:
+        engine = PredictionEngine(aggregation=args.aggregation)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    try:
+        prediction = engine.generate_prediction(force_refresh=True)
+    except PredictionError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.no_save:
+        db = DatabaseManager(args.db)
+        try:
+            db.save_prediction(prediction)
+        finally:
+            db.close()
+
+    if args.json:
+        json.dump(asdict(prediction), sys.stdout, indent=2)
+        print()
+    else:
+        _print_prediction(prediction, sys.stdout)
+    return 0
+
+
+def _history_rows(db_name: str, limit: Optional[int]) -> Iterator[tuple]:
+    """Stream stored rows, newest first, closing the database when exhausted."""
+    db = DatabaseManager(db_name)
+    try:
+        yield from db.iter_history() if limit is None else db.get_history_page(limit=limit)
+    finally:
+        db.close()
+
+
+def _dump_json_rows(rows: Iterable[tuple], out: TextIO) -> int:
+    """Write rows as a JSON array of objects one at a time; return the count.
+
+    Produces the same text as ``json.dump(list_of_dicts, out, indent=2)``
+    without building the list.
+    """
+    count = 0
+    for row in rows:
+        item = json.dumps(dict(zip(HISTORY_COLUMNS, row)), indent=2).replace("\n", "\n  ")
+        out.write(("[\n  " if count == 0 else ",\n  ") + item)
+        count += 1
+    out.write("\n]\n" if count else "[]\n")
+    return count
+
+
+def _cmd_history(args: argparse.Namespace) -> int:
+    rows = _history_rows(args.db, args.limit)
+    if args.json:
+        _dump_json_rows(rows, sys.stdout)
+        return 0
+
+    first = next(rows, None)
+    if first is None:
+        print("No predictions stored yet.")
+        return 0
+    columns = ("timestamp", "agi_date", "asi_date", "singularity_date", "asi_context")
+    indices = [HISTORY_COLUMNS.index(c) for c in columns]
+    print("  ".join(f"{c:<22}" for c in columns).rstrip())
+    for row in chain((first,), rows):
+        print("  ".join(f"{str(row[i]):<22}" for i in indices).rstrip())
+    return 0
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    rows = _history_rows(args.db, args.limit)
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            count = _dump_json_rows(rows, out)
+        else:
+            count = 0
+            writer = csv.writer(out)
+            writer.writerow(HISTORY_COLUMNS)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    finally:
+        rows.close()
+        if out is not sys.stdout:
+            out.close()
+    if args.output:
+        print(f"Exported {count} predictions to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _cmd_daemon(args: argparse.Namespace) -> int:
+    db = DatabaseManager(args.db)
+    try:
+        daemon = PollingDaemon(
+            PredictionEngine(),
+            db,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            backoff=args.backoff,
+        )
+    except ValueError as e:
+        db.close()
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from .server import PredictionService, create_server
+    from .snapshot import SnapshotStore
+
+    engine = PredictionEngine(
+        cache_ttl_seconds=args.cache_ttl,
+        stale_ttl_seconds=args.stale_ttl,
+        snapshot_store=SnapshotStore(args.db),
+    )
+    db = DatabaseManager(args.db, check_same_thread=False)
+    server = create_server(PredictionService(engine, db), args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}", file=sys.stderr)
+
+    # shutdown() would deadlock from inside serve_forever's thread; unwind instead
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        db.close()
+    return 0
+
+
+def _cmd_benchmark(args: argparse.Namespace) -> int:
+    from . import bench
+
+    if args.suite == "database":
+        print(bench.format_database_results(bench.benchmark_database()))
+    else:
+        results = bench.benchmark_aggregation(
+            sizes=args.sizes, repeats=args.repeats, seed=args.seed
+        )
+        print(bench.format_results(results, args.sizes))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aioracle",
+        description="AGI/ASI timeline predictions from live forecasting platforms.",
+    )
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="log progress (-vv for debug output)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    predict = subparsers.add_parser("predict", help="fetch forecasts and print a prediction")
+    predict.add_argument("--db", default=DEFAULT_DB, help="history database file")
+    predict.add_argument("--no-save", action="store_true",
+                         help="do not store the prediction in history")
+    predict.add_argument("--aggregation", default="weighted_mean",
+                         help="aggregation strategy (default: weighted_mean)")
+    predict.add_argument("--json", action="store_true", help="print JSON")
+    predict.set_defaults(func=_cmd_predict)
+
+    history = subparsers.add_parser("history", help="print stored predictions")
+    history.add_argument("--db", default=DEFAULT_DB, help="history database file")
+    history.add_argument("-n", "--limit", type=int, help="show at most this many rows")
+    history.add_argument("--json", action="store_true", help="print JSON")
+    history.set_defaults(func=_cmd_history)
+
+    export = subparsers.add_parser("export", help="export stored predictions")
+    export.add_argument("--db", default=DEFAULT_DB, help="history database file")
+    export.add_argument("-f", "--format", choices=("csv", "json"), default="csv")
+    export.add_argument("-o", "--output", help="output file (default: stdout)")
+    export.add_argument("-n", "--limit", type=int, help="export at most this many rows")
+    export.set_defaults(func=_cmd_export)
+
+    daemon = subparsers.add_parser("daemon", help="poll sources and store changed predictions")
+    daemon.add_argument("--db", default=DEFAULT_DB, help="history database file")
+    daemon.add_argument("--min-interval", type=float, default=MIN_INTERVAL,
+                        help=f"shortest wait between polls in seconds (default: {MIN_INTERVAL})")
+    daemon.add_argument("--max-interval", type=float, default=MAX_INTERVAL,
+                        help=f"longest wait between polls in seconds (default: {MAX_INTERVAL})")
+    daemon.add_argument("--backoff", type=float, default=2.0,
+                        help="interval growth factor when nothing changed (default: 2)")
+    daemon.set_defaults(func=_cmd_daemon)
+
+    serve = subparsers.add_parser("serve", help="serve predictions over local HTTP/JSON")
+    serve.add_argument("--db", default=DEFAULT_DB, help="history database file")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--cache-ttl", type=int, default=300,
+                       help="seconds before forecasts are refetched (default: 300)")
+    serve.add_argument("--stale-ttl", type=int, default=3600,
+                       help="seconds stale forecasts may be served during a refresh "
+                            "(default: 3600)")
+    serve.set_defaults(func=_cmd_serve)
+
+    benchmark = subparsers.add_parser("benchmark",
+                                      help="measure aggregation or database performance")
+    benchmark.add_argument("suite", nargs="?", choices=("aggregation", "database"),
+                           default="aggregation")
+    benchmark.add_argument("--sizes", type=int, nargs="+",
+                           default=[1_000, 10_000, 100_000, 1_000_000],
+                           help="synthetic dataset sizes")
+    benchmark.add_argument("--repeats", type=int, default=5,
+                           help="timed runs per strategy and size")
+    benchmark.add_argument("--seed", type=int, default=0)
+    benchmark.set_defaults(func=_cmd_benchmark)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(
+            level=logging.DEBUG if args.verbose > 1 else logging.INFO,
+            format="%(levelname)s %(name)s: %(message)s",
+        )
+    return args.func(args)
@@ -0,0 +1,146 @@
+"""Headless polling daemon that keeps the prediction history current.
+
+``PollingDaemon`` refreshes forecasts on a schedule and adapts the interval
+to how often upstream data actually changes: every poll that finds the same
+data (by ``ForecastBatch.fingerprint``) stretches the interval by
+``backoff`` up to ``max_interval``; a poll that finds new data shrinks it
+back toward ``min_interval``. A prediction is written only when it differs
+from the last stored one, so quiet periods cost neither network round trips
+(responses are revalidated through the HTTP cache) nor database writes.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, replace
+from threading import Event
+from typing import Optional
+
+from .backend import PredictionEngine, PredictionError
+from .db import DatabaseManager
+from .models import Prediction
+
+logger = logging.getLogger(__name__)
+
+# Default polling bounds (seconds)
+MIN_INTERVAL = 5 * 60
+MAX_INTERVAL = 6 * 60 * 60
+
+
+@dataclass(frozen=True)
+class PollResult:
+    """Outcome of one poll."""
+    data_changed: bool
+    saved: bool
+    next_interval: float
+    error: Optional[PredictionError | sqlite3.Error] = None
+
+
+def _same_prediction(a: Prediction, b: Prediction) -> bool:
+    """Compare predictions ignoring when they were generated."""
+    return replace(a, timestamp="") == replace(b, timestamp="")
+
+
+class PollingDaemon:
+    """Polls forecast sources with an adaptive interval and records changes.
+
+    Example:
+        >>> daemon = PollingDaemon(PredictionEngine(), DatabaseManager())
+        >>> daemon.run()            # blocks until stop() is called
+    """
+
+    def __init__(
+        self,
+        engine: PredictionEngine,
+        db: DatabaseManager,
+        min_interval: float = MIN_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        backoff: float = 2.0,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            engine: Engine used to fetch and analyze forecasts.
+            db: History database; only used from the thread calling ``run``.
+            min_interval: Shortest wait between polls (seconds).
+            max_interval: Longest wait between polls (seconds).
+            backoff: Factor the interval grows by after an unchanged poll
+                (or a failed one) and shrinks by after a changed one.
+
+        Raises:
+            ValueError: If the bounds or backoff factor are invalid.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+
+        self.engine = engine
+        self.db = db
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self._fingerprint: Optional[str] = None
+        self._last_saved: Optional[Prediction] = None
+        self._stop = Event()
+
+    def poll(self) -> PollResult:
+        """Fetch once, save the prediction if it changed and adapt the interval.
+
+        Fetch failures and database errors (e.g. the history file locked by
+        another writer) are logged and back the interval off like an
+        unchanged poll; they never propagate out of ``run``.
+        """
+        try:
+            batch = self.engine.fetch_data(force_refresh=True)
+            fingerprint = batch.fingerprint()
+            data_changed = fingerprint != self._fingerprint
+
+            saved = False
+            if data_changed:
+                prediction = self.engine.analyze(points=batch).prediction
+                if self._last_saved is None:
+                    self._last_saved = self.db.get_latest_prediction()
+                if self._last_saved is None or not _same_prediction(prediction, self._last_saved):
+                    self.db.save_prediction(prediction)
+                    self._last_saved = prediction
+                    saved = True
+            # Only remember data that was analyzed and stored successfully,
+            # so a failed write is retried on the next poll
+            self._fingerprint = fingerprint
+        except (PredictionError, sqlite3.Error) as e:
+            logger.warning(f"Poll failed: {e}")
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+            return PollResult(data_changed=False, saved=False,
+                              next_interval=self.interval, error=e)
+
+        if data_changed:
+            self.interval = max(self.min_interval, self.interval / self.backoff)
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+        logger.info(
+            f"Poll: data {'changed' if data_changed else 'unchanged'}, "
+            f"{'saved' if saved else 'no write'}, next in {self.interval:.0f}s"
+        )
+        return PollResult(data_changed=data_changed, saved=saved, next_interval=self.interval)
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """Poll until ``stop`` is called (or ``max_polls`` polls have run)."""
+        self._stop.clear()
+        polls = 0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            # Measure the interval from poll start so slow fetches don't drift
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stop(self) -> None:
+        """Ask ``run`` to return; safe to call from other threads or signal handlers."""
+        self._stop.set()
@@ -1,15 +1,85 @@
 from __future__ import annotations
 
 import sqlite3
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
 
 from .models import Prediction
 
+# Column order of rows returned by get_history
+HISTORY_COLUMNS = (
+    "id", "timestamp", "agi_date", "agi_type", "agi_prob",
+    "asi_date", "asi_context", "singularity_date", "singularity_prob",
+)
+
+# Rows pulled from SQLite per fetchmany call by iter_history
+HISTORY_BATCH_SIZE = 500
+
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """SQLite pragmas applied when a connection is opened.
+
+    WAL lets readers run alongside a writer, and with synchronous=NORMAL a
+    commit appends to the log without an fsync (the log is synced at
+    checkpoints; a power loss can drop the latest commits but never corrupts
+    the database). A negative cache_size is in KiB.
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 64 * 1024 * 1024
+    cache_size: int = -16_000
+    temp_store: str = "MEMORY"
+
+    def __post_init__(self) -> None:
+        # Pragmas cannot be parameterized, so only known values are allowed
+        for value, allowed in ((self.journal_mode, _JOURNAL_MODES),
+                               (self.synchronous, _SYNCHRONOUS),
+                               (self.temp_store, _TEMP_STORES)):
+            if value.upper() not in allowed:
+                raise ValueError(f"Unsupported pragma value: {value!r}")
+
+    def pragmas(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode.upper()}",
+            f"PRAGMA synchronous={self.synchronous.upper()}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA cache_size={int(self.cache_size)}",
+            f"PRAGMA temp_store={self.temp_store.upper()}",
+        ]
+
+
+DEFAULT_PROFILE = PerformanceProfile()
+
+# SQLite's stock settings: rollback journal and an fsync on every commit
+LEGACY_PROFILE = PerformanceProfile(
+    journal_mode="DELETE", synchronous="FULL", mmap_size=0, cache_size=-2000,
+    temp_store="DEFAULT",
+)
+
 
 class DatabaseManager:
-    def __init__(self, db_name: str = "ai_predictions.db"):
-        self.conn = sqlite3.connect(db_name)
+    def __init__(
+        self,
+        db_name: str = "ai_predictions.db",
+        check_same_thread: bool = True,
+        profile: PerformanceProfile = DEFAULT_PROFILE,
+    ):
+        # Pass check_same_thread=False only when callers serialize access themselves
+        self.conn = sqlite3.connect(db_name, check_same_thread=check_same_thread)
+        self.profile = profile
+        self._apply_profile()
         self._create_table()
 
+    def _apply_profile(self) -> None:
+        for pragma in self.profile.pragmas():
+            self.conn.execute(pragma)
+
     def _create_table(self) -> None:
         cursor = self.conn.cursor()
         cursor.execute(
@@ -27,6 +97,10 @@ class DatabaseManager:
             )
             """
         )
+        # Serves ORDER BY timestamp DESC, id DESC (id is the rowid, stored in every index entry)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_predictions_timestamp ON predictions (timestamp)"
+        )
         self.conn.commit()
 
     def close(self) -> None:
@@ -49,7 +123,124 @@ class DatabaseManager:
         )
         self.conn.commit()
 
+    def data_version(self) -> int:
+        # Changes whenever another connection commits to the database
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_latest_prediction(self) -> Optional[Prediction]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT timestamp, agi_date, agi_type, agi_prob,
+                   asi_date, asi_context, singularity_date, singularity_prob
+            FROM predictions ORDER BY timestamp DESC, id DESC LIMIT 1
+            """
+        )
+        row = cursor.fetchone()
+        return None if row is None else Prediction(*row)
+
     def get_history(self) -> list[tuple]:
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM predictions ORDER BY timestamp DESC")
+        cursor.execute("SELECT * FROM predictions ORDER BY timestamp DESC, id DESC")
+        return cursor.fetchall()
+
+    def iter_history(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = HISTORY_BATCH_SIZE,
+    ) -> Iterator[tuple]:
+        """Stream history rows, newest first, ``batch_size`` rows at a time.
+
+        Only one batch is held in memory, so exports and charts can walk
+        histories of any size. ``columns`` selects a subset of
+        ``HISTORY_COLUMNS`` (rows then follow that order) instead of every
+        column.
+
+        Raises:
+            ValueError: If a column is not in ``HISTORY_COLUMNS`` or
+                batch_size is not positive.
+        """
+        if columns is None:
+            columns = HISTORY_COLUMNS
+        if not columns:
+            raise ValueError("columns must not be empty")
+        unknown = [c for c in columns if c not in HISTORY_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown history columns: {', '.join(unknown)}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        return self._iter_history(", ".join(columns), batch_size)
+
+    def _iter_history(self, projection: str, batch_size: int) -> Iterator[tuple]:
+        # Identifiers can't be parameterized; projection holds validated names only
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"SELECT {projection} FROM predictions ORDER BY timestamp DESC, id DESC"
+            )
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_history_page(
+        self,
+        before_ts: Optional[str] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[tuple]:
+        """One page of history, newest first, via keyset pagination.
+
+        Pass the timestamp (and id, to page through equal timestamps) of the
+        last row of the previous page to get the next one. Each page is an
+        index range scan, so cost does not grow with the table or page depth.
+
+        Raises:
+            ValueError: If before_id is given without before_ts.
+        """
+        if before_id is not None and before_ts is None:
+            raise ValueError("before_id requires before_ts")
+        cursor = self.conn.cursor()
+        if before_ts is None:
+            cursor.execute(
+                "SELECT * FROM predictions ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (limit,),
+            )
+        elif before_id is None:
+            cursor.execute(
+                "SELECT * FROM predictions WHERE timestamp < ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (before_ts, limit),
+            )
+        else:
+            cursor.execute(
+                "SELECT * FROM predictions WHERE (timestamp, id) < (?, ?) "
+                "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (before_ts, before_id, limit),
+            )
+        return cursor.fetchall()
+
+    def get_history_range(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> list[tuple]:
+        """History with ``start <= timestamp <= end``, newest first.
+
+        Bounds are ISO timestamps (a date prefix such as "2025-01" works as
+        a lower bound); None leaves that side open.
+        """
+        # Only bind the bounds that are set so SQLite can seek on each one
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("timestamp <= ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM predictions {where}ORDER BY timestamp DESC, id DESC",
+            params,
+        )
         return cursor.fetchall()
@@ -0,0 +1,172 @@
+"""Persistent on-disk HTTP response cache.
+
+Responses are stored in SQLite keyed by URL + query parameters together with
+their validators (``ETag`` / ``Last-Modified``) and ``Cache-Control`` freshness
+lifetime. Fresh entries are served locally; stale ones are revalidated with a
+conditional request so unchanged payloads come back as cheap 304s. Because
+the cache lives on disk it survives app restarts.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlencode
+
+DEFAULT_CACHE_PATH = "aioracle_http_cache.db"
+
+# Seconds to wait on a database locked by another process before giving up;
+# kept short because callers fall back to the network rather than wait
+BUSY_TIMEOUT = 0.5
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Subset of ``Cache-Control`` directives relevant to a private client."""
+    max_age: Optional[float] = None
+    no_store: bool = False
+    no_cache: bool = False
+
+    @classmethod
+    def parse(cls, header: Optional[str]) -> "CachePolicy":
+        """Parse a ``Cache-Control`` header value."""
+        if not header:
+            return cls()
+
+        max_age: Optional[float] = None
+        no_store = no_cache = False
+        for directive in header.lower().split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "no-store":
+                no_store = True
+            elif name == "no-cache":
+                no_cache = True
+            elif name == "max-age":
+                try:
+                    max_age = max(0.0, float(value.strip('"')))
+                except ValueError:
+                    pass
+        return cls(max_age=max_age, no_store=no_store, no_cache=no_cache)
+
+    @property
+    def freshness(self) -> float:
+        """Seconds the response may be served without revalidation."""
+        if self.no_cache or self.max_age is None:
+            return 0.0
+        return self.max_age
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with its validators."""
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    max_age: float
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for revalidating this entry with the origin."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed HTTP response cache, safe to share across threads."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, timeout: float = BUSY_TIMEOUT):
+        self.conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._lock = Lock()
+        self._create_table()
+
+    def _create_table(self) -> None:
+        with self._lock:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    max_age REAL NOT NULL
+                )
+                """
+            )
+            self.conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """Build a cache key from a URL and its query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response for ``key``, if any."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, stored_at, max_age "
+                "FROM http_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            body=row[0], etag=row[1], last_modified=row[2],
+            stored_at=row[3], max_age=row[4],
+        )
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        max_age: float,
+    ) -> None:
+        """Store or replace a response."""
+        # Roll back on failure so a busy database can't leave a transaction open
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_responses "
+                "(key, body, etag, last_modified, stored_at, max_age) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, time.time(), max_age),
+            )
+
+    def touch(self, key: str, max_age: float) -> None:
+        """Mark an entry as just revalidated (after a 304)."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE http_responses SET stored_at = ?, max_age = ? WHERE key = ?",
+                (time.time(), max_age, key),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM http_responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM http_responses")
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
@@ -0,0 +1,181 @@
+"""Shared HTTP client for the scrapers.
+
+A single ``requests.Session`` is reused across all sources so repeated calls
+to the same API host ride on pooled keep-alive connections instead of paying
+a fresh TCP+TLS handshake per request. An optional on-disk
+``ResponseCache`` lets unchanged payloads be served locally or revalidated
+with a conditional request.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
+
+from .http_cache import CachePolicy, ResponseCache
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Default timeouts for HTTP requests (seconds)
+CONNECT_TIMEOUT = 5
+REQUEST_TIMEOUT = 20
+
+
+def _accept_encoding() -> str:
+    """Advertise brotli only when urllib3 can actually decode it."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+class HttpClient:
+    """Pooled, keep-alive HTTP client shared by the scrapers.
+
+    Example:
+        >>> client = HttpClient(pool_size=16, read_timeout=10)
+        >>> data = client.get_json("https://api.manifold.markets/v0/markets")
+    """
+
+    # Number of distinct hosts to keep pools for, and connections per host
+    POOL_HOSTS = 4
+    POOL_SIZE = 10
+
+    USER_AGENT = "aioracle/1.0"
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = REQUEST_TIMEOUT,
+        pool_hosts: int = POOL_HOSTS,
+        pool_size: int = POOL_SIZE,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection to be established.
+            read_timeout: Seconds to wait for the server to send data.
+            pool_hosts: Number of per-host connection pools to keep.
+            pool_size: Maximum keep-alive connections per host. Should be at
+                least the number of concurrent requests made to one host.
+            session: Optional preconfigured session, e.g. for testing.
+            cache: Optional response cache used by ``get_json``.
+        """
+        # Imported here so headless tools that never fetch skip loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.session = session or requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": _accept_encoding(),
+            "User-Agent": self.USER_AGENT,
+        })
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> requests.Response:
+        """Issue a GET request and raise for non-2xx responses."""
+        resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp
+
+    def get_json(self, url: str, params: Optional[dict] = None) -> Any:
+        """Issue a GET request and decode the JSON body.
+
+        With a cache configured, fresh entries are returned without touching
+        the network and stale ones are revalidated via ``If-None-Match`` /
+        ``If-Modified-Since``; a 304 reuses the stored body. Cache errors
+        (e.g. a database locked by another process) are logged and the
+        request proceeds as if uncached.
+        """
+        if self.cache is None:
+            return self.get(url, params=params).json()
+
+        key = ResponseCache.make_key(url, params)
+        try:
+            cached = self.cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed, fetching uncached: {e}")
+            cached = None
+        if cached is not None and cached.is_fresh():
+            return json.loads(cached.body)
+
+        headers = cached.conditional_headers() if cached is not None else None
+        resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        policy = CachePolicy.parse(resp.headers.get("Cache-Control"))
+
+        if resp.status_code == 304 and cached is not None:
+            try:
+                self.cache.touch(key, policy.freshness)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache update failed: {e}")
+            return json.loads(cached.body)
+
+        resp.raise_for_status()
+        data = resp.json()
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        try:
+            if policy.no_store or not (etag or last_modified or policy.freshness):
+                # Nothing to validate against and no freshness lifetime
+                if cached is not None:
+                    self.cache.delete(key)
+            else:
+                self.cache.put(key, resp.content, etag, last_modified, policy.freshness)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache update failed: {e}")
+
+        return data
+
+    def close(self) -> None:
+        """Close all pooled connections and the response cache."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = Lock()
+
+
+def get_default_client() -> HttpClient:
+    """Return the process-wide shared client, creating it on first use.
+
+    The shared client persists responses to ``DEFAULT_CACHE_PATH`` so
+    unchanged upstream data is cheap across refreshes and restarts. If the
+    cache file cannot be opened (e.g. a read-only working directory), the
+    client runs uncached.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            try:
+                cache: Optional[ResponseCache] = ResponseCache()
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache unavailable, running uncached: {e}")
+                cache = None
+            _default_client = HttpClient(cache=cache)
+        return _default_client
@@ -0,0 +1,217 @@
+"""Incremental per-category statistics for repeated predictions.
+
+``IncrementalAggregator`` keeps running sufficient statistics for every
+category (weighted sums, Welford mean/variance, a sorted list of years for
+the median, per-source counts) and applies add/remove/update deltas. After a
+small refresh only the changed forecasts are reclassified and folded in, so
+re-predicting costs O(changed points) rather than O(all points).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, Iterable, Optional
+
+from .batch import ForecastBatch
+
+# Category that tracks every point regardless of classification
+ALL = "all"
+
+
+def _weight(num_forecasters: int) -> float:
+    """Aggregation weight: sqrt(num_forecasters) with a floor of 1."""
+    return max(1, num_forecasters) ** 0.5
+
+
+class RunningStats:
+    """Sufficient statistics for one set of forecasts, updatable in place."""
+
+    __slots__ = ("count", "weight_sum", "weighted_year_sum", "mean", "_m2",
+                 "_sorted_years", "source_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.weight_sum = 0.0
+        self.weighted_year_sum = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._sorted_years: list[float] = []
+        self.source_counts: Counter[str] = Counter()
+
+    def add(self, year: float, weight: float, source: str) -> None:
+        self.count += 1
+        self.weight_sum += weight
+        self.weighted_year_sum += year * weight
+        # Welford update
+        delta = year - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (year - self.mean)
+        insort(self._sorted_years, year)
+        self.source_counts[source] += 1
+
+    def remove(self, year: float, weight: float, source: str) -> None:
+        if self.count <= 1:
+            self.__init__()
+            return
+
+        self.weight_sum -= weight
+        self.weighted_year_sum -= year * weight
+        # Inverse Welford update
+        old_mean = (self.count * self.mean - year) / (self.count - 1)
+        self._m2 -= (year - old_mean) * (year - self.mean)
+        self.mean = old_mean
+        self.count -= 1
+        del self._sorted_years[bisect_left(self._sorted_years, year)]
+        self.source_counts[source] -= 1
+        if self.source_counts[source] <= 0:
+            del self.source_counts[source]
+
+    @property
+    def weighted_mean(self) -> float:
+        if self.weight_sum:
+            return self.weighted_year_sum / self.weight_sum
+        return self._sorted_years[0]
+
+    @property
+    def median(self) -> float:
+        years = self._sorted_years
+        mid = len(years) // 2
+        if len(years) % 2:
+            return years[mid]
+        return (years[mid - 1] + years[mid]) / 2
+
+    @property
+    def stdev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return max(0.0, self._m2 / (self.count - 1)) ** 0.5
+
+    @property
+    def sources(self) -> set[str]:
+        return set(self.source_counts)
+
+
+@dataclass(frozen=True)
+class DeltaSummary:
+    """How many forecasts a sync added, removed and updated."""
+    added: int
+    removed: int
+    updated: int
+
+
+# (source, question, url, occurrence) - occurrence disambiguates duplicates
+PointKey = tuple[str, str, str, int]
+
+
+class IncrementalAggregator:
+    """Per-category running statistics maintained from point deltas.
+
+    Example:
+        >>> aggregator = IncrementalAggregator(classifier.categorize)
+        >>> aggregator.sync(batch)          # first call: O(n)
+        >>> aggregator.sync(refreshed)      # later: O(changed points)
+        >>> aggregator.stats("agi").weighted_mean
+    """
+
+    def __init__(self, categorize: Callable[[str], str]):
+        """Initialize the aggregator.
+
+        Args:
+            categorize: Maps a question text to its category name.
+        """
+        self._categorize = categorize
+        self._lock = Lock()
+        # key -> (category, year, weight, source)
+        self._points: dict[Hashable, tuple[str, float, float, str]] = {}
+        self._stats: dict[str, RunningStats] = {ALL: RunningStats()}
+
+    def reset(self, categorize: Optional[Callable[[str], str]] = None) -> None:
+        """Forget all state, optionally switching the categorize function."""
+        with self._lock:
+            if categorize is not None:
+                self._categorize = categorize
+            self._points.clear()
+            self._stats = {ALL: RunningStats()}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def stats(self, category: str) -> RunningStats:
+        """Running statistics for ``category`` (or ``ALL``)."""
+        with self._lock:
+            return self._stats.setdefault(category, RunningStats())
+
+    def _fold(self, entry: tuple[str, float, float, str], sign: int) -> None:
+        category, year, weight, source = entry
+        for name in (category, ALL):
+            stats = self._stats.setdefault(name, RunningStats())
+            if sign > 0:
+                stats.add(year, weight, source)
+            else:
+                stats.remove(year, weight, source)
+
+    def add(self, key: Hashable, source: str, question: str,
+            median_year: float, num_forecasters: int) -> None:
+        """Add a forecast, or replace the one already stored under ``key``."""
+        entry = (self._categorize(question), median_year, _weight(num_forecasters), source)
+        with self._lock:
+            old = self._points.get(key)
+            if old is not None:
+                self._fold(old, -1)
+            self._points[key] = entry
+            self._fold(entry, +1)
+
+    # Updates are replacements keyed by identity
+    update = add
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a forecast; returns False if ``key`` was unknown."""
+        with self._lock:
+            old = self._points.pop(key, None)
+            if old is None:
+                return False
+            self._fold(old, -1)
+            return True
+
+    @staticmethod
+    def keys_for(batch: ForecastBatch) -> Iterable[PointKey]:
+        """Identity keys for each row of ``batch``, in order."""
+        seen: Counter[tuple[str, str, str]] = Counter()
+        for i in range(len(batch)):
+            base = (batch.source(i), batch.question(i), batch.url(i))
+            yield base + (seen[base],)
+            seen[base] += 1
+
+    def sync(self, batch: ForecastBatch) -> DeltaSummary:
+        """Bring the statistics in line with ``batch`` by applying deltas.
+
+        Unchanged rows cost one dictionary lookup; only added, removed or
+        changed rows are reclassified and folded into the statistics.
+        """
+        current: dict[PointKey, int] = {
+            key: i for i, key in enumerate(self.keys_for(batch))
+        }
+
+        with self._lock:
+            removed_keys = [k for k in self._points if k not in current]
+
+        for key in removed_keys:
+            self.remove(key)
+
+        added = updated = 0
+        for key, i in current.items():
+            year = batch.years[i]
+            weight = _weight(batch.forecasters[i])
+            old = self._points.get(key)
+            if old is not None and old[1] == year and old[2] == weight:
+                continue
+            if old is None:
+                added += 1
+            else:
+                updated += 1
+            self.add(key, batch.source(i), batch.question(i), year, batch.forecasters[i])
+
+        return DeltaSummary(added=added, removed=len(removed_keys), updated=updated)
@@ -0,0 +1,108 @@
+"""Single-pass multi-keyword matching for question classification.
+
+All keyword sets are folded into one prefix trie and compiled into a single
+regular expression, so at any text position the regex engine branches on the
+next character instead of trying every keyword in turn. Matching cost is
+linear in text length and largely independent of how many keywords there are.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Optional, Sequence
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation of ``words`` with shared prefixes factored out."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-word marker
+
+    def render(node: dict) -> str:
+        end = "" in node
+        branches = [re.escape(char) + render(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Shorter keyword ends here, so the rest is optional
+        return f"(?:{body})?" if end else body
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """Matches text against prioritized keyword categories in one scan.
+
+    Keywords match as plain case-insensitive substrings. When keywords from
+    several categories occur in a text, the category listed first wins.
+
+    Example:
+        >>> matcher = KeywordMatcher([("asi", ["superintelligence"]), ("agi", ["agi"])])
+        >>> matcher.match("AGI or superintelligence by 2040?")
+        'asi'
+    """
+
+    def __init__(self, categories: Sequence[tuple[str, Iterable[str]]]):
+        """Compile the matcher.
+
+        Args:
+            categories: (name, keywords) pairs in priority order, highest first.
+        """
+        self.categories = [name for name, _ in categories]
+
+        # Best (lowest) category rank of each keyword
+        rank_of: dict[str, int] = {}
+        for rank, (_, keywords) in enumerate(categories):
+            for kw in keywords:
+                kw = kw.lower()
+                if kw and kw not in rank_of:
+                    rank_of[kw] = rank
+
+        # The trie regex yields the longest keyword starting at a position;
+        # any shorter keyword starting there is one of its prefixes, so fold
+        # the prefixes' ranks into each keyword up front.
+        self._rank_sets: dict[str, frozenset[int]] = {
+            kw: frozenset(r for other, r in rank_of.items() if kw.startswith(other))
+            for kw in rank_of
+        }
+        self._ranks: dict[str, int] = {kw: min(r) for kw, r in self._rank_sets.items()}
+        self._pattern: Optional[re.Pattern] = (
+            re.compile(_trie_pattern(rank_of)) if rank_of else None
+        )
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the highest-priority category with a keyword in ``text``."""
+        if self._pattern is None:
+            return None
+
+        text = text.lower()
+        search = self._pattern.search
+        best: Optional[int] = None
+        m = search(text)
+        while m is not None:
+            rank = self._ranks[m.group()]
+            if rank == 0:
+                return self.categories[0]
+            if best is None or rank < best:
+                best = rank
+            # Resume one character in so overlapping keywords are not missed
+            m = search(text, m.start() + 1)
+        return None if best is None else self.categories[best]
+
+    def match_all(self, text: str) -> set[str]:
+        """Return every category with at least one keyword in ``text``."""
+        if self._pattern is None:
+            return set()
+
+        text = text.lower()
+        search = self._pattern.search
+        ranks: set[int] = set()
+        m = search(text)
+        while m is not None:
+            ranks |= self._rank_sets[m.group()]
+            m = search(text, m.start() + 1)
+        return {self.categories[rank] for rank in ranks}
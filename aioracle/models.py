@@ -1,6 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ForecastPoint:
+    """A single forecast data point."""
+    source: str
+    question: str
+    median_year: float
+    num_forecasters: int
+    url: str = ""
+    # Last upstream update as a Unix timestamp, when the source reports one
+    updated_at: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,175 @@
+"""Loadable classification rule sets.
+
+A rule set lists categories with a priority, plain keywords, regular
+expressions and negations. It is compiled once into a ``CompiledRuleSet``
+(all keywords share a single ``KeywordMatcher`` scan) and can be swapped into
+a running ``ForecastClassifier`` without rebuilding the engine.
+
+JSON format::
+
+    {
+        "default_category": "agi",
+        "categories": [
+            {
+                "name": "singularity",
+                "priority": 0,
+                "keywords": ["singularity", "intelligence explosion"],
+                "patterns": ["recursive(ly)? self[- ]improv"],
+                "negations": ["singularity (university|institute)"]
+            }
+        ]
+    }
+
+Lower ``priority`` values win when several categories match. Keywords are
+case-insensitive substrings; ``patterns`` and ``negations`` are
+case-insensitive regular expressions. A category whose negation matches the
+text is skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .matcher import KeywordMatcher
+
+
+class RuleSetError(ValueError):
+    """Raised when a rule set is malformed."""
+    pass
+
+
+def _compile_any(patterns: tuple[str, ...], what: str) -> Optional[re.Pattern]:
+    """Compile ``patterns`` into one case-insensitive alternation."""
+    if not patterns:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error as e:
+        raise RuleSetError(f"Invalid {what} pattern: {e}") from e
+
+
+def _string_list(data: dict[str, Any], key: str) -> tuple[str, ...]:
+    """Read a list-of-strings field, rejecting bare strings and other values."""
+    value = data.get(key, ())
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+        raise RuleSetError(f"Category field {key!r} must be a list of strings")
+    return tuple(value)
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    """Matching rule for one category."""
+    name: str
+    priority: int = 0
+    keywords: tuple[str, ...] = ()
+    patterns: tuple[str, ...] = ()
+    negations: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CategoryRule":
+        """Build a rule from its JSON representation."""
+        if not isinstance(data, dict):
+            raise RuleSetError("Category rule must be an object")
+        unknown = set(data) - {"name", "priority", "keywords", "patterns", "negations"}
+        if unknown:
+            raise RuleSetError(f"Unknown category fields: {sorted(unknown)}")
+        name = data.get("name")
+        if not name or not isinstance(name, str):
+            raise RuleSetError("Category rule needs a non-empty string name")
+        priority = data.get("priority", 0)
+        # bool is an int subclass, but true/false is never a meaningful priority
+        if not isinstance(priority, int) or isinstance(priority, bool):
+            raise RuleSetError(f"Category {name!r} priority must be an integer")
+        return cls(
+            name=name,
+            priority=priority,
+            keywords=_string_list(data, "keywords"),
+            patterns=_string_list(data, "patterns"),
+            negations=_string_list(data, "negations"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "priority": self.priority,
+            "keywords": list(self.keywords),
+            "patterns": list(self.patterns),
+            "negations": list(self.negations),
+        }
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """An ordered collection of category rules plus a fallback category."""
+    categories: tuple[CategoryRule, ...] = field(default_factory=tuple)
+    default_category: str = "agi"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RuleSet":
+        """Build a rule set from its JSON representation."""
+        try:
+            categories = tuple(CategoryRule.from_dict(c) for c in data["categories"])
+        except (KeyError, TypeError) as e:
+            raise RuleSetError(f"Malformed rule set: {e}") from e
+        default_category = data.get("default_category", "agi")
+        if not default_category or not isinstance(default_category, str):
+            raise RuleSetError("default_category must be a non-empty string")
+        return cls(categories=categories, default_category=default_category)
+
+    @classmethod
+    def from_json(cls, path: str) -> "RuleSet":
+        """Load a rule set from a JSON file.
+
+        Raises:
+            RuleSetError: If the file is not valid JSON or not a valid rule set.
+            OSError: If the file cannot be read.
+        """
+        with open(path, encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise RuleSetError(f"Invalid rule set JSON in {path}: {e}") from e
+        return cls.from_dict(data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "default_category": self.default_category,
+            "categories": [c.to_dict() for c in self.categories],
+        }
+
+    def compile(self) -> "CompiledRuleSet":
+        """Compile the rule set into a matcher."""
+        return CompiledRuleSet(self)
+
+
+class CompiledRuleSet:
+    """A rule set compiled for fast repeated matching."""
+
+    def __init__(self, rules: RuleSet):
+        self.rules = rules
+        # Stable sort keeps file order among equal priorities
+        self._ordered = sorted(rules.categories, key=lambda c: c.priority)
+        self.category_names = [c.name for c in self._ordered]
+
+        self._keywords = KeywordMatcher([(c.name, c.keywords) for c in self._ordered])
+        self._patterns = [_compile_any(c.patterns, "category") for c in self._ordered]
+        self._negations = [_compile_any(c.negations, "negation") for c in self._ordered]
+        # Without regexes or negations the keyword matcher alone decides
+        self._keywords_only = not any(self._patterns) and not any(self._negations)
+
+    def match(self, text: str) -> str:
+        """Return the category for ``text``."""
+        if self._keywords_only:
+            return self._keywords.match(text) or self.rules.default_category
+
+        keyword_hits = self._keywords.match_all(text)
+        for rule, pattern, negation in zip(self._ordered, self._patterns, self._negations):
+            hit = rule.name in keyword_hits or (
+                pattern is not None and pattern.search(text) is not None
+            )
+            if hit and (negation is None or negation.search(text) is None):
+                return rule.name
+        return self.rules.default_category
@@ -10,26 +10,37 @@ Sources:
 
 from __future__ import annotations
 
+import queue
 import re
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import urljoin
 
-import requests
+from .aggregation import DEFAULT_STRATEGY, get_strategy
+from .batch import ForecastBatch
+from .http_client import REQUEST_TIMEOUT, HttpClient, get_default_client  # noqa: F401
+from .models import ForecastPoint
+from .stats import forecaster_weights
 
-# Timeout for HTTP requests (seconds)
-REQUEST_TIMEOUT = 20
+# Global deadline for a concurrent refresh across all sources (seconds)
+FETCH_DEADLINE = 45
 
 
-@dataclass
-class ForecastPoint:
-    """A single forecast data point."""
-    source: str
-    question: str
-    median_year: float
-    num_forecasters: int
-    url: str = ""
+def _parse_timestamp(value) -> Optional[float]:
+    """Parse an API timestamp (epoch seconds/milliseconds or ISO 8601)."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            # Manifold reports milliseconds
+            return value / 1000 if value > 1e11 else float(value)
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (ValueError, OverflowError):
+        return None
 
 
 class MetaculusScraper:
@@ -48,6 +59,17 @@ class MetaculusScraper:
         "AI singularity",
     ]
 
+    # Default cap on concurrent Metaculus requests (searches + details)
+    MAX_IN_FLIGHT = 8
+
+    def __init__(
+        self,
+        client: Optional[HttpClient] = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        self.client = client or get_default_client()
+        self.max_in_flight = max(1, max_in_flight)
+
     def _parse_prediction_date(self, data: dict) -> Optional[float]:
         """Extract median prediction year from question data."""
         # Try community prediction first
@@ -90,9 +112,7 @@ class MetaculusScraper:
             "order_by": "-activity",
         }
         try:
-            resp = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self.client.get_json(url, params=params)
             return data.get("results", [])
         except Exception:
             return []
@@ -101,48 +121,94 @@ class MetaculusScraper:
         """Fetch detailed data for a specific question."""
         url = f"{self.BASE_URL}/questions/{question_id}/"
         try:
-            resp = requests.get(url, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            return resp.json()
+            return self.client.get_json(url)
         except Exception:
             return None
 
+    def _build_point(self, qid: int, detail: Optional[dict]) -> Optional[ForecastPoint]:
+        """Turn a question detail payload into a ForecastPoint, if usable."""
+        if not detail:
+            return None
+
+        median_year = self._parse_prediction_date(detail)
+        if median_year is None:
+            return None
+
+        # Only include if it's a date-type prediction in reasonable range
+        if not (2025 < median_year < 2200):
+            return None
+
+        return ForecastPoint(
+            source="Metaculus",
+            question=detail.get("title", f"Question {qid}"),
+            median_year=median_year,
+            num_forecasters=detail.get("number_of_predictions", 0),
+            url=f"https://www.metaculus.com/questions/{qid}/",
+            updated_at=_parse_timestamp(
+                detail.get("last_activity_time") or detail.get("edited_time")
+            ),
+        )
+
+    def _fetch_point(self, qid: int) -> Optional[ForecastPoint]:
+        """Fetch one question's detail and convert it to a ForecastPoint."""
+        return self._build_point(qid, self.fetch_question_detail(qid))
+
     def fetch_all(self) -> list[ForecastPoint]:
-        """Search and fetch all AI-timeline related forecasts."""
-        results: list[ForecastPoint] = []
-        seen_ids: set[int] = set()
-
-        for term in self.SEARCH_TERMS:
-            questions = self.search_questions(term, limit=10)
-            
-            for q in questions:
-                qid = q.get("id")
-                if not qid or qid in seen_ids:
-                    continue
-                seen_ids.add(qid)
-
-                # Get detailed question data
-                detail = self.fetch_question_detail(qid)
-                if not detail:
-                    continue
-
-                median_year = self._parse_prediction_date(detail)
-                if median_year is None:
-                    continue
-
-                # Only include if it's a date-type prediction in reasonable range
-                if not (2025 < median_year < 2200):
-                    continue
-
-                results.append(ForecastPoint(
-                    source="Metaculus",
-                    question=detail.get("title", f"Question {qid}"),
-                    median_year=median_year,
-                    num_forecasters=detail.get("number_of_predictions", 0),
-                    url=f"https://www.metaculus.com/questions/{qid}/",
-                ))
+        """Search and fetch all AI-timeline related forecasts.
+
+        Searches run concurrently and each result page is fed straight into
+        detail fetches as soon as it arrives, with at most ``max_in_flight``
+        requests outstanding at once. Requests are handed to the pool only
+        when a slot frees up, so nothing waits in its queue; if the process
+        exits mid-fetch, only the in-flight requests are waited for. Output
+        order matches a serial walk of ``SEARCH_TERMS``.
+        """
+        # qid -> earliest (term index, rank) it was seen at, for stable ordering
+        order: dict[int, tuple[int, int]] = {}
+        points: dict[int, ForecastPoint] = {}
+
+        # (term index, qid) of requests not yet submitted; qid is None for searches
+        queued: deque[tuple[Optional[int], Optional[int]]] = deque(
+            (term_idx, None) for term_idx in range(len(self.SEARCH_TERMS))
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="aioracle-metaculus"
+        ) as executor:
+            pending: dict[Future, tuple[Optional[int], Optional[int]]] = {}
+
+            while queued or pending:
+                while queued and len(pending) < self.max_in_flight:
+                    term_idx, qid = queued.popleft()
+                    if qid is None:
+                        future = executor.submit(
+                            self.search_questions, self.SEARCH_TERMS[term_idx], 10
+                        )
+                    else:
+                        future = executor.submit(self._fetch_point, qid)
+                    pending[future] = (term_idx, qid)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    term_idx, qid = pending.pop(future)
+
+                    if qid is not None:
+                        point = future.result()
+                        if point is not None:
+                            points[qid] = point
+                        continue
 
-        return results
+                    for rank, q in enumerate(future.result()):
+                        qid = q.get("id")
+                        if not qid:
+                            continue
+                        if qid in order:
+                            order[qid] = min(order[qid], (term_idx, rank))
+                            continue
+                        order[qid] = (term_idx, rank)
+                        queued.append((None, qid))
+
+        return [points[qid] for qid in sorted(points, key=order.__getitem__)]
 
 
 class PolymarketScraper:
@@ -150,6 +216,9 @@ class PolymarketScraper:
 
     BASE_URL = "https://gamma-api.polymarket.com"
 
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or get_default_client()
+
     def fetch_ai_markets(self) -> list[ForecastPoint]:
         """Fetch AI-related prediction markets."""
         results: list[ForecastPoint] = []
@@ -161,9 +230,7 @@ class PolymarketScraper:
             try:
                 url = f"{self.BASE_URL}/markets"
                 params = {"_q": term, "_limit": 20}
-                resp = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
-                resp.raise_for_status()
-                markets = resp.json()
+                markets = self.client.get_json(url, params=params)
 
                 for market in markets:
                     if not isinstance(market, dict):
@@ -191,6 +258,7 @@ class PolymarketScraper:
                         median_year=float(year),
                         num_forecasters=int(volume / 10),  # Rough estimate
                         url=market.get("url", ""),
+                        updated_at=_parse_timestamp(market.get("updatedAt")),
                     ))
 
             except Exception:
@@ -204,6 +272,9 @@ class ManifoldScraper:
 
     BASE_URL = "https://api.manifold.markets/v0"
 
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or get_default_client()
+
     def fetch_ai_markets(self) -> list[ForecastPoint]:
         """Fetch AI-related prediction markets."""
         results: list[ForecastPoint] = []
@@ -214,9 +285,7 @@ class ManifoldScraper:
             try:
                 url = f"{self.BASE_URL}/search-markets"
                 params = {"term": term, "limit": 20}
-                resp = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
-                resp.raise_for_status()
-                markets = resp.json()
+                markets = self.client.get_json(url, params=params)
 
                 for market in markets:
                     if not isinstance(market, dict):
@@ -243,6 +312,7 @@ class ManifoldScraper:
                         median_year=float(year),
                         num_forecasters=unique_bettors,
                         url=market.get("url", ""),
+                        updated_at=_parse_timestamp(market.get("lastUpdatedTime")),
                     ))
 
             except Exception:
@@ -251,59 +321,141 @@ class ManifoldScraper:
         return results
 
 
-def aggregate_forecasts(points: list[ForecastPoint]) -> float:
-    """Weighted median of forecast years (weight = sqrt(num_forecasters))."""
-    if not points:
+def aggregate_forecasts(
+    points: ForecastBatch | list[ForecastPoint],
+    method: str = DEFAULT_STRATEGY,
+) -> float:
+    """Aggregate forecast years with weight = sqrt(num_forecasters).
+
+    Args:
+        points: Forecasts to aggregate.
+        method: Name of a registered aggregation strategy (see
+            ``aioracle.aggregation.available_strategies``); defaults to
+            "weighted_mean".
+
+    Raises:
+        ValueError: If ``method`` is not a registered strategy.
+    """
+    strategy = get_strategy(method)
+
+    if not len(points):
         # No data available - return a neutral "unknown" indicator
         return float(datetime.now().year + 25)
 
-    # Weighted average using sqrt of forecaster count
-    total_weight = 0.0
-    weighted_sum = 0.0
-    for p in points:
-        w = max(1, p.num_forecasters) ** 0.5
-        weighted_sum += p.median_year * w
-        total_weight += w
+    batch = ForecastBatch.coerce(points)
+    weights = forecaster_weights(batch.forecaster_values())
+    return float(strategy(batch.year_values(), weights, batch.timestamp_values()))
 
-    return weighted_sum / total_weight if total_weight else points[0].median_year
 
+def _default_sources(
+    client: Optional[HttpClient] = None,
+) -> list[tuple[str, Callable[[], list[ForecastPoint]]]]:
+    """Return (name, fetch callable) pairs for every forecast source."""
+    client = client or get_default_client()
+    return [
+        ("Metaculus", MetaculusScraper(client).fetch_all),  # prediction platform
+        ("Polymarket", PolymarketScraper(client).fetch_ai_markets),  # prediction market
+        ("Manifold", ManifoldScraper(client).fetch_ai_markets),  # prediction market
+    ]
 
-def fetch_agi_forecasts() -> tuple[list[ForecastPoint], float]:
-    """Fetch ALL forecasts from ALL sources and return (points, aggregated_year).
-    
-    This function performs LIVE web scraping on every call.
+
+def _fetch_sequential(
+    sources: list[tuple[str, Callable[[], list[ForecastPoint]]]],
+) -> list[list[ForecastPoint]]:
+    """Run each source one after another."""
+    results: list[list[ForecastPoint]] = []
+    for _, fetch in sources:
+        try:
+            results.append(fetch())
+        except Exception:
+            results.append([])
+    return results
+
+
+def _fetch_concurrent(
+    sources: list[tuple[str, Callable[[], list[ForecastPoint]]]],
+    deadline: float,
+) -> list[list[ForecastPoint]]:
+    """Run all sources in parallel, keeping whatever finished before the deadline.
+
+    Each source runs on a daemon thread, so a source still running at the
+    deadline is abandoned without holding the interpreter open at exit (a
+    pool worker would be joined). Its result is discarded. Requests a source
+    already has in flight on its own pool (Metaculus) are still waited for
+    at exit, which bounds shutdown by one request timeout.
     """
-    all_points: list[ForecastPoint] = []
+    finished: queue.SimpleQueue[tuple[int, list[ForecastPoint]]] = queue.SimpleQueue()
 
-    # Metaculus - prediction platform
-    try:
-        metaculus = MetaculusScraper()
-        all_points.extend(metaculus.fetch_all())
-    except Exception:
-        pass
+    def run(index: int, fetch: Callable[[], list[ForecastPoint]]) -> None:
+        try:
+            points = fetch()
+        except Exception:
+            points = []
+        finished.put((index, points))
 
-    # Polymarket - prediction market
-    try:
-        polymarket = PolymarketScraper()
-        all_points.extend(polymarket.fetch_ai_markets())
-    except Exception:
-        pass
+    for index, (name, fetch) in enumerate(sources):
+        threading.Thread(
+            target=run, args=(index, fetch), name=f"aioracle-source-{name}", daemon=True
+        ).start()
 
-    # Manifold Markets - prediction market
-    try:
-        manifold = ManifoldScraper()
-        all_points.extend(manifold.fetch_ai_markets())
-    except Exception:
-        pass
+    results: list[list[ForecastPoint]] = [[] for _ in sources]
+    stop_at = time.monotonic() + deadline
+    for _ in sources:
+        try:
+            index, points = finished.get(timeout=max(0.0, stop_at - time.monotonic()))
+        except queue.Empty:
+            break
+        results[index] = points
+    return results
+
+
+def fetch_forecast_batch(
+    concurrent: bool = True,
+    deadline: float = FETCH_DEADLINE,
+    client: Optional[HttpClient] = None,
+) -> ForecastBatch:
+    """Fetch ALL forecasts from ALL sources into a deduplicated ForecastBatch.
+    
+    This function performs LIVE web scraping on every call.
 
-    # Deduplicate by similar questions
-    unique_points: list[ForecastPoint] = []
+    Args:
+        concurrent: If True, query all sources in parallel so a refresh costs
+            roughly the slowest source instead of the sum of all of them.
+        deadline: Seconds to wait for the concurrent fetch; sources that have
+            not finished by then are skipped. Ignored when ``concurrent`` is
+            False.
+        client: HTTP client shared by all scrapers. Defaults to the
+            process-wide pooled client.
+    """
+    sources = _default_sources(client)
+    if concurrent:
+        per_source = _fetch_concurrent(sources, deadline)
+    else:
+        per_source = _fetch_sequential(sources)
+
+    # Deduplicate by similar questions, walking sources in order so the
+    # result is deterministic
+    batch = ForecastBatch()
     seen_titles: set[str] = set()
-    for p in all_points:
-        title_key = p.question.lower()[:50]
-        if title_key not in seen_titles:
-            seen_titles.add(title_key)
-            unique_points.append(p)
-
-    agg = aggregate_forecasts(unique_points)
-    return unique_points, agg
+    for points in per_source:
+        for p in points:
+            title_key = p.question.lower()[:50]
+            if title_key not in seen_titles:
+                seen_titles.add(title_key)
+                batch.append_point(p)
+
+    return batch
+
+
+def fetch_agi_forecasts(
+    concurrent: bool = True,
+    deadline: float = FETCH_DEADLINE,
+    client: Optional[HttpClient] = None,
+) -> tuple[list[ForecastPoint], float]:
+    """Fetch ALL forecasts from ALL sources and return (points, aggregated_year).
+    
+    This function performs LIVE web scraping on every call. See
+    ``fetch_forecast_batch`` for the arguments.
+    """
+    batch = fetch_forecast_batch(concurrent=concurrent, deadline=deadline, client=client)
+    return batch.to_points(), aggregate_forecasts(batch)
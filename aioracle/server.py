@@ -0,0 +1,211 @@
+"""Local HTTP/JSON prediction service.
+
+Endpoints (GET):
+    /prediction          Latest prediction
+    /analysis            Prediction, per-category metrics and bootstrap intervals
+    /history?limit=N     Stored predictions, newest first (default 100)
+
+Responses are serialized once and reused: prediction and analysis bodies
+are rebuilt only when ``PredictionEngine`` hands out a different cached
+batch, and history bodies only when SQLite's ``data_version`` reports a
+commit from another connection. Every response carries a strong ETag, and
+``If-None-Match`` requests are answered with 304 and no body, so steady-state
+requests do no computation at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from .backend import PredictionEngine, PredictionError
+from .batch import ForecastBatch
+from .db import HISTORY_COLUMNS, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+DEFAULT_HISTORY_LIMIT = 100
+MAX_HISTORY_LIMIT = 10_000
+
+# Distinct history limits kept serialized at once
+HISTORY_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class _Response:
+    """A serialized JSON body and its ETag."""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_json(cls, payload) -> "_Response":
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"')
+
+
+class PredictionService:
+    """Builds and caches the serialized responses served over HTTP."""
+
+    def __init__(self, engine: PredictionEngine, db: DatabaseManager):
+        """Initialize the service.
+
+        Args:
+            engine: Engine whose cache backs the prediction endpoints; give
+                it a cache TTL, otherwise every request refetches.
+            db: History database opened with ``check_same_thread=False``.
+        """
+        self.engine = engine
+        self.db = db
+        self._lock = Lock()
+        self._db_lock = Lock()
+        self._batch: Optional[ForecastBatch] = None
+        self._prediction: Optional[_Response] = None
+        self._analysis: Optional[_Response] = None
+        self._history_version: Optional[int] = None
+        self._history: dict[int, _Response] = {}
+
+    def _refresh_locked(self) -> None:
+        """Rebuild the prediction bodies if the engine's cached batch changed."""
+        batch = self.engine.fetch_data()
+        if batch is self._batch:
+            return
+
+        analysis = self.engine.analyze(points=batch)
+        intervals = self.engine.confidence_intervals(analysis)
+        prediction = asdict(analysis.prediction)
+        self._prediction = _Response.from_json(prediction)
+        self._analysis = _Response.from_json({
+            "prediction": prediction,
+            "total_data_points": len(analysis.points),
+            "sources": sorted(analysis.points.source_names()),
+            "metrics": {c: asdict(m) for c, m in analysis.metrics.items()},
+            "intervals": {c: asdict(ci) for c, ci in intervals.items()},
+        })
+        self._batch = batch
+        logger.info(f"Rebuilt prediction responses for {len(batch)} points")
+
+    def prediction(self) -> _Response:
+        with self._lock:
+            self._refresh_locked()
+            return self._prediction
+
+    def analysis(self) -> _Response:
+        with self._lock:
+            self._refresh_locked()
+            return self._analysis
+
+    def history(self, limit: int = DEFAULT_HISTORY_LIMIT) -> _Response:
+        with self._db_lock:
+            version = self.db.data_version()
+            if version != self._history_version:
+                self._history.clear()
+                self._history_version = version
+
+            response = self._history.get(limit)
+            if response is None:
+                rows = self.db.get_history_page(limit=limit)
+                response = _Response.from_json([dict(zip(HISTORY_COLUMNS, r)) for r in rows])
+                if len(self._history) >= HISTORY_CACHE_SIZE:
+                    self._history.pop(next(iter(self._history)))
+                self._history[limit] = response
+            return response
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to a ``PredictionService``."""
+
+    # Keep-alive lets clients reuse one connection across requests
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment rather than waiting on delayed ACKs
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    server_version = "aioracle"
+    service: PredictionService
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        try:
+            if url.path == "/prediction":
+                response = self.service.prediction()
+            elif url.path == "/analysis":
+                response = self.service.analysis()
+            elif url.path == "/history":
+                try:
+                    limit = self._history_limit(url.query)
+                except ValueError as e:
+                    self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+                    return
+                response = self.service.history(limit)
+            else:
+                self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint {url.path}")
+                return
+        except PredictionError as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+
+        if self._etag_matches(response.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", response.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self._send_body(HTTPStatus.OK, response.body, response.etag)
+
+    def _etag_matches(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return "*" in tags or etag in tags
+
+    @staticmethod
+    def _history_limit(query: str) -> int:
+        values = parse_qs(query).get("limit")
+        if not values:
+            return DEFAULT_HISTORY_LIMIT
+        try:
+            limit = int(values[0])
+        except ValueError:
+            raise ValueError("limit must be an integer") from None
+        if not 1 <= limit <= MAX_HISTORY_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_HISTORY_LIMIT}")
+        return limit
+
+    def _send_body(self, status: HTTPStatus, body: bytes, etag: Optional[str] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_body(status, json.dumps({"error": message}).encode("utf-8"))
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+def create_server(
+    service: PredictionService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> ThreadingHTTPServer:
+    """Bind a threaded HTTP server for ``service`` (call ``serve_forever`` to run)."""
+    handler = type("Handler", (PredictionRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
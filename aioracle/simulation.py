@@ -0,0 +1,187 @@
+"""Monte Carlo takeoff-scenario simulation.
+
+AGI and ASI years are each modelled as a shifted log-normal fitted to the
+category's forecasts (weighted by sqrt(num_forecasters)), which captures the
+long right tail of timeline forecasts. Paired draws are pushed through the
+same ordering rule as the point prediction (an ASI year not after the AGI
+year becomes AGI + 5) and bucketed by AGI-to-ASI gap into the takeoff
+scenarios, giving a probability mix instead of a single threshold.
+
+With NumPy, draws are generated in vectorized chunks; large runs can be
+spread over a process pool. Chunk seeds are spawned from one
+``SeedSequence``, so a seed yields the same mix with or without a pool.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .stats import forecaster_weights, get_numpy
+
+# AGI-to-ASI gaps (years) separating rapid, moderate and slow takeoff
+RAPID_GAP_YEARS = 5
+MODERATE_GAP_YEARS = 15
+
+# ASI years not after AGI are moved to AGI + this many years
+MIN_ASI_GAP_YEARS = 5
+
+DEFAULT_DRAWS = 1_000_000
+
+# Draws per vectorized chunk (two float64 arrays of this length per chunk)
+CHUNK_DRAWS = 250_000
+
+# Below this many draws, process start-up costs more than it saves
+PARALLEL_MIN_DRAWS = 4_000_000
+
+
+@dataclass(frozen=True)
+class YearDistribution:
+    """Shifted log-normal: ``origin + exp(Normal(mu, sigma))``."""
+    origin: float
+    mu: float
+    sigma: float
+
+    @classmethod
+    def fit(
+        cls,
+        years: Sequence[float],
+        num_forecasters: Sequence[int],
+        origin: Optional[float] = None,
+    ) -> "YearDistribution":
+        """Fit to forecast years by weighted moments of ``log(year - origin)``.
+
+        Args:
+            years: Non-empty sequence of forecast years.
+            num_forecasters: Forecaster counts, turned into sqrt weights.
+            origin: Lower bound of the support; defaults to one year before
+                the earliest forecast.
+
+        Raises:
+            ValueError: If ``years`` is empty.
+        """
+        if not len(years):
+            raise ValueError("YearDistribution.fit() requires at least one year")
+        if origin is None:
+            origin = math.floor(min(years)) - 1.0
+
+        weights = [float(w) for w in forecaster_weights(num_forecasters)]
+        logs = [math.log(max(y - origin, 1e-3)) for y in years]
+        total = math.fsum(weights)
+        if not total:
+            weights, total = [1.0] * len(logs), float(len(logs))
+        mu = math.fsum(w * x for w, x in zip(weights, logs)) / total
+        var = math.fsum(w * (x - mu) ** 2 for w, x in zip(weights, logs)) / total
+        return cls(origin=float(origin), mu=mu, sigma=math.sqrt(var))
+
+    @property
+    def median(self) -> float:
+        return self.origin + math.exp(self.mu)
+
+
+@dataclass(frozen=True)
+class ScenarioMix:
+    """Share of simulated draws falling into each takeoff scenario."""
+    rapid: float
+    moderate: float
+    slow: float
+    draws: int
+    # Mean simulated years, after the ordering rule
+    mean_agi_year: float
+    mean_asi_year: float
+
+
+def _simulate_chunk(agi: YearDistribution, asi: YearDistribution,
+                    draws: int, seed_seq) -> tuple[int, int, float, float]:
+    """Simulate one chunk; returns (rapid, moderate, agi_sum, asi_sum).
+
+    Runs in worker processes.
+    """
+    np = get_numpy()
+    rng = np.random.default_rng(seed_seq)
+    agi_years = agi.origin + rng.lognormal(agi.mu, agi.sigma, draws)
+    asi_years = asi.origin + rng.lognormal(asi.mu, asi.sigma, draws)
+    asi_years = np.where(asi_years <= agi_years, agi_years + MIN_ASI_GAP_YEARS, asi_years)
+    gaps = asi_years - agi_years
+    rapid = int(np.count_nonzero(gaps < RAPID_GAP_YEARS))
+    moderate = int(np.count_nonzero(gaps < MODERATE_GAP_YEARS)) - rapid
+    return rapid, moderate, float(agi_years.sum()), float(asi_years.sum())
+
+
+def _simulate_python(agi: YearDistribution, asi: YearDistribution,
+                     draws: int, seed: int) -> tuple[int, int, float, float]:
+    """Pure-Python equivalent of ``_simulate_chunk`` for installs without NumPy."""
+    rng = random.Random(seed)
+    rapid = moderate = 0
+    agi_sum = asi_sum = 0.0
+    for _ in range(draws):
+        agi_year = agi.origin + rng.lognormvariate(agi.mu, agi.sigma)
+        asi_year = asi.origin + rng.lognormvariate(asi.mu, asi.sigma)
+        if asi_year <= agi_year:
+            asi_year = agi_year + MIN_ASI_GAP_YEARS
+        gap = asi_year - agi_year
+        if gap < RAPID_GAP_YEARS:
+            rapid += 1
+        elif gap < MODERATE_GAP_YEARS:
+            moderate += 1
+        agi_sum += agi_year
+        asi_sum += asi_year
+    return rapid, moderate, agi_sum, asi_sum
+
+
+def simulate_scenarios(
+    agi: YearDistribution,
+    asi: YearDistribution,
+    draws: int = DEFAULT_DRAWS,
+    seed: int = 0,
+    processes: Optional[int] = None,
+) -> ScenarioMix:
+    """Estimate the takeoff-scenario mix from independent AGI/ASI draws.
+
+    Args:
+        agi: Fitted AGI year distribution.
+        asi: Fitted ASI year distribution.
+        draws: Number of simulated (AGI, ASI) pairs.
+        seed: Seed making the simulation reproducible.
+        processes: Worker processes for large runs; None or 1 runs in this
+            process. Ignored without NumPy.
+
+    Raises:
+        ValueError: If ``draws`` is not positive.
+    """
+    if draws < 1:
+        raise ValueError("draws must be positive")
+
+    np = get_numpy()
+    if np is None:
+        rapid, moderate, agi_sum, asi_sum = _simulate_python(agi, asi, draws, seed)
+    else:
+        sizes = [CHUNK_DRAWS] * (draws // CHUNK_DRAWS)
+        if draws % CHUNK_DRAWS:
+            sizes.append(draws % CHUNK_DRAWS)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = ([agi] * len(sizes), [asi] * len(sizes), sizes, seeds)
+
+        if processes and processes > 1 and draws >= PARALLEL_MIN_DRAWS:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_simulate_chunk, *args))
+        else:
+            results = list(map(_simulate_chunk, *args))
+
+        rapid = sum(r[0] for r in results)
+        moderate = sum(r[1] for r in results)
+        agi_sum = math.fsum(r[2] for r in results)
+        asi_sum = math.fsum(r[3] for r in results)
+
+    return ScenarioMix(
+        rapid=rapid / draws,
+        moderate=moderate / draws,
+        slow=(draws - rapid - moderate) / draws,
+        draws=draws,
+        mean_agi_year=agi_sum / draws,
+        mean_asi_year=asi_sum / draws,
+    )
@@ -0,0 +1,102 @@
+"""Persisted snapshot of the last validated forecast points.
+
+Lets ``PredictionEngine`` show a prediction immediately on launch, before the
+first multi-source scrape has finished.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+
+from .batch import ForecastBatch
+
+
+class SnapshotStore:
+    def __init__(self, db_name: str = "ai_predictions.db"):
+        # Saved from the engine's refresh threads, so allow cross-thread use
+        self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self._lock = Lock()
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS forecast_snapshot (
+                    position INTEGER PRIMARY KEY,
+                    source TEXT,
+                    question TEXT,
+                    median_year REAL,
+                    num_forecasters INTEGER,
+                    url TEXT,
+                    updated_at REAL
+                )
+                """
+            )
+            # Snapshots written before update timestamps were tracked
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(forecast_snapshot)")}
+            if "updated_at" not in columns:
+                cursor.execute("ALTER TABLE forecast_snapshot ADD COLUMN updated_at REAL")
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS forecast_snapshot_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    saved_at TEXT
+                )
+                """
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    def save(self, batch: ForecastBatch) -> None:
+        """Replace the stored snapshot with ``batch`` in one transaction."""
+        rows = [
+            (i, batch.source(i), batch.question(i), batch.years[i],
+             batch.forecasters[i], batch.url(i), batch.timestamp(i))
+            for i in range(len(batch))
+        ]
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM forecast_snapshot")
+            self.conn.executemany(
+                """
+                INSERT INTO forecast_snapshot (
+                    position, source, question, median_year, num_forecasters, url,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO forecast_snapshot_meta (id, saved_at) VALUES (1, ?)",
+                (datetime.now().isoformat(),),
+            )
+
+    def load(self) -> Optional[tuple[ForecastBatch, datetime]]:
+        """Return the stored (batch, saved_at), or None if there is none."""
+        with self._lock:
+            meta = self.conn.execute(
+                "SELECT saved_at FROM forecast_snapshot_meta WHERE id = 1"
+            ).fetchone()
+            if meta is None:
+                return None
+            rows = self.conn.execute(
+                "SELECT source, question, median_year, num_forecasters, url, updated_at "
+                "FROM forecast_snapshot ORDER BY position"
+            ).fetchall()
+
+        if not rows:
+            return None
+        batch = ForecastBatch()
+        for row in rows:
+            batch.append(*row)
+        return batch, datetime.fromisoformat(meta[0])
@@ -0,0 +1,201 @@
+"""Numeric kernels for forecast aggregation.
+
+Operates on plain sequences of years and weights. When NumPy is installed,
+inputs above a small size are handled in a single vectorized pass; otherwise
+the pure-Python ``statistics`` implementation is used. NumPy is imported
+lazily so importing this module stays cheap.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
+
+# Below this many values the NumPy call overhead outweighs vectorization
+NUMPY_MIN_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Return the ``numpy`` module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _use_numpy(n: int):
+    """Return NumPy if it should handle an input of ``n`` values."""
+    return get_numpy() if n >= NUMPY_MIN_SIZE else None
+
+
+@dataclass(frozen=True)
+class YearSummary:
+    """Summary statistics over a set of forecast years."""
+    count: int
+    mean: float
+    weighted_mean: float
+    median: float
+    stdev: float
+
+
+def forecaster_weights(num_forecasters: Sequence[int]) -> Sequence[float]:
+    """Per-point weights of sqrt(num_forecasters), with a floor of 1."""
+    np = _use_numpy(len(num_forecasters))
+    if np is not None:
+        return np.sqrt(np.maximum(np.asarray(num_forecasters, dtype=np.float64), 1.0))
+    return [max(1, n) ** 0.5 for n in num_forecasters]
+
+
+def weighted_mean(years: Sequence[float], weights: Sequence[float]) -> float:
+    """Weighted mean of ``years``; falls back to the first year on zero weight."""
+    np = _use_numpy(len(years))
+    if np is not None:
+        y = np.asarray(years, dtype=np.float64)
+        w = np.asarray(weights, dtype=np.float64)
+        total_weight = float(w.sum())
+        return float(y @ w) / total_weight if total_weight else float(y[0])
+
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for year, w in zip(years, weights):
+        weighted_sum += year * w
+        total_weight += w
+    return weighted_sum / total_weight if total_weight else float(years[0])
+
+
+def summarize(
+    years: Sequence[float],
+    weights: Optional[Sequence[float]] = None,
+) -> YearSummary:
+    """Compute mean, weighted mean, median and sample stdev in one pass.
+
+    Args:
+        years: Non-empty sequence of forecast years.
+        weights: Optional per-year weights; defaults to uniform.
+
+    Returns:
+        YearSummary for the input.
+    """
+    n = len(years)
+    if n == 0:
+        raise ValueError("summarize() requires at least one year")
+
+    np = _use_numpy(n)
+    if np is not None:
+        y = np.asarray(years, dtype=np.float64)
+        mean = float(y.mean())
+        if weights is None:
+            wmean = mean
+        else:
+            w = np.asarray(weights, dtype=np.float64)
+            total_weight = float(w.sum())
+            wmean = float(y @ w) / total_weight if total_weight else float(y[0])
+        return YearSummary(
+            count=n,
+            mean=mean,
+            weighted_mean=wmean,
+            median=float(np.median(y)),
+            stdev=float(y.std(ddof=1)) if n > 1 else 0.0,
+        )
+
+    mean = float(statistics.mean(years))
+    return YearSummary(
+        count=n,
+        mean=mean,
+        weighted_mean=mean if weights is None else float(weighted_mean(years, weights)),
+        median=float(statistics.median(years)),
+        stdev=float(statistics.stdev(years)) if n > 1 else 0.0,
+    )
+
+
+
+def _quantile_select(years: Sequence[float], weights: Sequence[float], q: float) -> float:
+    """Weighted quantile by weighted quickselect, expected O(n).
+
+    Returns the smallest year whose cumulative weight reaches ``q`` of the
+    total; when it lands exactly on the target, averages with the next year.
+    """
+    items = list(zip(years, weights))
+    target = q * math.fsum(weights)
+    below = 0.0  # weight of discarded items smaller than everything in items
+    upper: Optional[float] = None  # smallest discarded item above items
+
+    while True:
+        pivot = random.choice(items)[0]
+        lower = [(y, w) for y, w in items if y < pivot]
+        lower_weight = math.fsum(w for _, w in lower)
+        if lower and below + lower_weight >= target:
+            items = lower
+            upper = pivot
+            continue
+
+        below += lower_weight
+        pivot_weight = math.fsum(w for y, w in items if y == pivot)
+        higher = [(y, w) for y, w in items if y > pivot]
+        if below + pivot_weight >= target or not higher:
+            cumulative = below + pivot_weight
+            if math.isclose(cumulative, target, rel_tol=1e-12):
+                following = min((y for y, _ in higher), default=upper)
+                if following is not None:
+                    return (pivot + following) / 2
+            return float(pivot)
+
+        below += pivot_weight
+        items = higher
+
+
+def weighted_quantiles(
+    years: Sequence[float],
+    weights: Sequence[float],
+    qs: Sequence[float],
+) -> list[float]:
+    """Weighted quantiles of ``years`` for each ``q`` in ``qs`` (0..1).
+
+    With NumPy the years are sorted once and every quantile is found by a
+    binary search over the cumulative weights; without it each quantile uses
+    linear-time weighted selection. A quantile that falls exactly between two
+    years is their midpoint, so with equal weights the 0.5 quantile equals
+    the ordinary median.
+    """
+    n = len(years)
+    if n == 0:
+        raise ValueError("weighted_quantiles() requires at least one year")
+    if any(not 0.0 <= q <= 1.0 for q in qs):
+        raise ValueError("quantiles must be within [0, 1]")
+
+    np = _use_numpy(n)
+    if np is None:
+        if not math.fsum(weights):
+            # No usable weights: fall back to equal weighting
+            weights = [1.0] * n
+        return [_quantile_select(years, weights, q) for q in qs]
+
+    y = np.asarray(years, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+    order = np.argsort(y, kind="stable")
+    y_sorted = y[order]
+    cumulative = np.cumsum(w[order])
+    total = cumulative[-1]
+    if not total:
+        cumulative = np.arange(1, n + 1, dtype=np.float64)
+        total = float(n)
+
+    targets = np.asarray(qs, dtype=np.float64) * total
+    idx = np.minimum(np.searchsorted(cumulative, targets, side="left"), n - 1)
+    values = y_sorted[idx]
+    # Exactly on a boundary: midpoint with the next year
+    on_boundary = np.isclose(cumulative[idx], targets, rtol=1e-12, atol=0.0) & (idx + 1 < n)
+    following = y_sorted[np.minimum(idx + 1, n - 1)]
+    values = np.where(on_boundary, (values + following) / 2, values)
+    return [float(v) for v in values]
+
+
+def weighted_median(years: Sequence[float], weights: Sequence[float]) -> float:
+    """Weighted median of ``years``."""
+    return weighted_quantiles(years, weights, (0.5,))[0]
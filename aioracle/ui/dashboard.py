@@ -14,20 +14,28 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 
-from ..backend import PredictionEngine
+from ..backend import PredictionEngine, PredictionError
 from ..db import DatabaseManager
 from ..models import Prediction
+from ..snapshot import SnapshotStore
 from ..style import AppStyle
 from ..workers import AnalysisWorker
 
+# Seconds a fetched batch is reused, so the warm-start refresh isn't discarded
+CACHE_TTL_SECONDS = 300
+
 
 class DashboardTab(QWidget):
     def __init__(self, db_manager: DatabaseManager):
         super().__init__()
         self.db = db_manager
-        self.engine = PredictionEngine()
+        self.snapshot_store = SnapshotStore()
+        self.engine = PredictionEngine(
+            cache_ttl_seconds=CACHE_TTL_SECONDS, snapshot_store=self.snapshot_store
+        )
         self.worker: Optional[AnalysisWorker] = None
         self._init_ui()
+        self._show_snapshot()
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout()
@@ -117,6 +125,7 @@ class DashboardTab(QWidget):
         self.worker = AnalysisWorker(self.engine)
         self.worker.progress_update.connect(self._update_progress)
         self.worker.result_ready.connect(self._display_results)
+        self.worker.finished.connect(lambda: self.refresh_btn.setEnabled(True))
         self.worker.start()
 
     def _update_progress(self, value: int, msg: str) -> None:
@@ -127,7 +136,29 @@ class DashboardTab(QWidget):
         prediction = prediction_obj if isinstance(prediction_obj, Prediction) else Prediction.from_dict(prediction_obj)  # type: ignore[arg-type]
 
         self.status_label.setText("Prediction Complete (Confidence: High)")
+        self._fill_cards(prediction)
+
+        self.db.save_prediction(prediction)
+        self.refresh_btn.setEnabled(True)
+
+    def _show_snapshot(self) -> None:
+        # Warm start: show the last saved forecasts, then refresh through the worker
+        # (it joins the engine's background fetch) so the cards update when it lands
+        if not self.engine.has_snapshot:
+            return
+        try:
+            prediction = self.engine.generate_prediction()
+        except PredictionError:
+            return
 
+        self._fill_cards(prediction)
+        self.status_label.setText("Showing last saved forecasts (refreshing in background).")
+        self.start_analysis()
+
+    def shutdown(self) -> None:
+        self.snapshot_store.close()
+
+    def _fill_cards(self, prediction: Prediction) -> None:
         self.card_agi.lbl_date.setText(prediction.agi_date[:4])
         self.card_agi.lbl_detail.setText(
             f"Full Date: {prediction.agi_date}\nMode: {prediction.agi_type}\nProbability: {prediction.agi_prob}%"
@@ -140,6 +171,3 @@ class DashboardTab(QWidget):
         self.card_sing.lbl_detail.setText(
             f"Est. Date: {prediction.singularity_date}\nProbability: {prediction.singularity_prob}%"
         )
-
-        self.db.save_prediction(prediction)
-        self.refresh_btn.setEnabled(True)
@@ -58,41 +58,41 @@ class HistoryTab(QWidget):
         self.setLayout(layout)
 
     def load_history(self) -> None:
-        data = self.db.get_history()
+        rows = self.db.iter_history(columns=("timestamp", "agi_date", "asi_date", "singularity_date"))
         self.table.setRowCount(0)
 
         series_agi: list[tuple[datetime, datetime]] = []
         series_asi: list[tuple[datetime, datetime]] = []
         series_sing: list[tuple[datetime, datetime]] = []
 
-        for row in data:
+        for timestamp, agi_date, asi_date, sing_date in rows:
             row_idx = self.table.rowCount()
             self.table.insertRow(row_idx)
 
-            self.table.setItem(row_idx, 0, QTableWidgetItem(row[1][:16]))
-            self.table.setItem(row_idx, 1, QTableWidgetItem(row[2]))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(row[5]))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(row[7]))
+            self.table.setItem(row_idx, 0, QTableWidgetItem(timestamp[:16]))
+            self.table.setItem(row_idx, 1, QTableWidgetItem(agi_date))
+            self.table.setItem(row_idx, 2, QTableWidgetItem(asi_date))
+            self.table.setItem(row_idx, 3, QTableWidgetItem(sing_date))
 
             try:
-                ts = datetime.fromisoformat(row[1])
+                ts = datetime.fromisoformat(timestamp)
             except Exception:
                 continue
 
             try:
-                agi = datetime.strptime(row[2], "%Y-%m-%d")
+                agi = datetime.strptime(agi_date, "%Y-%m-%d")
                 series_agi.append((ts, agi))
             except Exception:
                 pass
 
             try:
-                asi = datetime.strptime(row[5], "%Y-%m-%d")
+                asi = datetime.strptime(asi_date, "%Y-%m-%d")
                 series_asi.append((ts, asi))
             except Exception:
                 pass
 
             try:
-                sing = datetime.strptime(row[7], "%Y-%m-%d")
+                sing = datetime.strptime(sing_date, "%Y-%m-%d")
                 series_sing.append((ts, sing))
             except Exception:
                 pass
@@ -69,6 +69,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         try:
+            self.dashboard.shutdown()
             self.db.close()
         finally:
             super().closeEvent(event)
@@ -24,7 +24,7 @@ class AnalysisWorker(QThread):
             self.progress_update.emit(55, "Scraping Manifold Markets...")
             
             # This fetches ALL data fresh from web
-            prediction: Prediction = self._engine.generate_prediction()
+            prediction: Prediction = self._engine.generate_prediction(force_refresh=True)
 
             self.progress_update.emit(85, "Aggregating forecasts (weighted analysis)...")
             self.progress_update.emit(100, "Done - fresh data analyzed!")